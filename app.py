@@ -8,15 +8,23 @@ st.title("Astella Napkin - Radar")
 #
 
 import io
-import numpy as np
-import matplotlib.pyplot as plt
+import os
+import shutil
+import tempfile
+import zipfile
+from collections import deque
+from datetime import date
 
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
 
-# -------------------------------
-# Configuração de página e fontes
-# -------------------------------
-plt.rcParams['font.family'] = 'sans-serif'
-plt.rcParams['font.sans-serif'] = ['Open Sans', 'Intelo', 'Montserrat', 'Arial', 'Helvetica', 'DejaVu Sans']
+from napkin_history import benchmarks_at
+from napkin_plot import FONT_FAMILY, best_fit_stage, figure_to_png, footnote_text, render_executor
+from napkin_store import read_portfolio
+from napkin_uncertainty import simulate
+from napkin_watch import output_name, resolve_benchmark
 
 
 # -------------------------------
@@ -37,28 +45,6 @@ COLORS = {
 }
 
 
-# -------------------------------
-# Benchmarks do Napkin por estágio
-# -------------------------------
-NAPKIN_BENCHMARKS = {
-    'Pre-Seed': {
-        'low':   {'ARR': 0.0,   'Growth': 0, 'Round Size': 0.460, 'Valuation': 2.750, 'Cap Table': 90, 'Gross Margin': 70},
-        'high':  {'ARR': 0.180, 'Growth': 0, 'Round Size': 0.920, 'Valuation': 6.410, 'Cap Table': 90, 'Gross Margin': 70},
-    },
-    'Seed': {
-        'low':   {'ARR': 0.64, 'Growth': 200, 'Round Size': 1.46, 'Valuation': 5.86, 'Cap Table': 80, 'Gross Margin': 70},
-        'high':  {'ARR': 1.83, 'Growth': 200, 'Round Size': 3.66, 'Valuation': 10.9, 'Cap Table': 80, 'Gross Margin': 70},
-    },
-    'Series A': {
-        'low':   {'ARR': 3.300, 'Growth': 150, 'Round Size': 4.580, 'Valuation': 13.730, 'Cap Table': 65, 'Gross Margin': 70},
-        'high':  {'ARR': 5.490, 'Growth': 150, 'Round Size': 9.150, 'Valuation': 36.620, 'Cap Table': 65, 'Gross Margin': 70},
-    },
-    'Series B': {
-        'low':   {'ARR': 9.150, 'Growth': 100, 'Round Size': 13.730, 'Valuation': 45.700, 'Cap Table': 50, 'Gross Margin': 70},
-        'high':  {'ARR': 36.620, 'Growth': 100, 'Round Size': 27.450, 'Valuation': 91.550, 'Cap Table': 50, 'Gross Margin': 70},
-    },
-}
-
 metrics = ['ARR', 'Growth', 'Round Size', 'Cap Table', 'Valuation', 'Gross Margin']
 metric_labels = ['ARR', 'Growth', 'Round Size', 'Cap Table', 'Valuation', 'Gross Margin']
 
@@ -143,21 +129,38 @@ def check_label_overlap(purple_value: float, napkin_value: float, threshold: flo
 # -------------------------------
 # Geração do gráfico radar
 # -------------------------------
-def generate_radar_chart(startup_metrics: dict, startup_name: str = "Startup"):
+def metric_axes(startup_metrics: dict, napkin_low: dict, napkin_high: dict) -> dict:
+    """Eixo da escala dinâmica por métrica: [min(napkin_low, startup), max(napkin_high, startup)]."""
+    axes = {}
+    for metric in metrics:
+        if napkin_low[metric] == napkin_high[metric]:
+            axes[metric] = (0.0, max(napkin_high[metric], startup_metrics[metric]))
+        else:
+            axes[metric] = (min(napkin_low[metric], startup_metrics[metric]),
+                            max(napkin_high[metric], startup_metrics[metric]))
+    return axes
+
+
+def normalize_per_metric_array(values, axes: dict) -> np.ndarray:
+    """Versão vetorizada da escala dinâmica por métrica (per_metric_scale) para values[N, M]."""
+    axis_min = np.array([axes[m][0] for m in metrics], dtype=float)
+    axis_max = np.array([axes[m][1] for m in metrics], dtype=float)
+    span = np.where(axis_max > axis_min, axis_max - axis_min, 1.0)
+    scaled = np.clip(40 + 60 * (np.asarray(values, dtype=float) - axis_min) / span, 40, 100)
+    return np.where(axis_max > axis_min, scaled, 70.0)  # caso degenerado
+
+
+def build_radar_figure(startup_metrics: dict, napkin_low: dict, napkin_high: dict, startup_name: str = "Startup",
+                       benchmark_version: str | None = None, envelope: tuple | None = None) -> Figure:
     # Normalização
     purple_normalized = []
     napkin_low_normalized = []
     napkin_high_normalized = []
 
+    axes = metric_axes(startup_metrics, napkin_low, napkin_high)
     for metric in metrics:
         benchmark_mid = (napkin_low[metric] + napkin_high[metric]) / 2
-        # Escala dinâmica por métrica: eixo [min(napkin_low, startup), max(napkin_high, startup)]
-        if napkin_low[metric] == napkin_high[metric]:
-            axis_min = 0.0
-            axis_max = max(napkin_high[metric], startup_metrics[metric])
-        else:
-            axis_min = min(napkin_low[metric], startup_metrics[metric])
-            axis_max = max(napkin_high[metric], startup_metrics[metric])
+        axis_min, axis_max = axes[metric]
         purple_norm = normalize_value(startup_metrics[metric], benchmark_mid, 'higher_better',
                                       low=napkin_low[metric], high=napkin_high[metric],
                                       axis_min=axis_min, axis_max=axis_max, per_metric_scale=True)
@@ -174,7 +177,9 @@ def generate_radar_chart(startup_metrics: dict, startup_name: str = "Startup"):
         napkin_high_normalized.append(min(100, high_norm))
 
     # Plot
-    fig = plt.figure(figsize=(14, 14), facecolor='white')
+    # API orientada a objetos: sem estado global do pyplot entre sessões (threads) do Streamlit
+    fig = Figure(figsize=(14, 14), facecolor='white')
+    FigureCanvasAgg(fig)
     ax = fig.add_subplot(111, projection='polar', facecolor='white')
 
     num_vars = len(metrics)
@@ -222,7 +227,7 @@ def generate_radar_chart(startup_metrics: dict, startup_name: str = "Startup"):
             napkin_text = f'{int(napkin_low["Gross Margin"])}%'
         ha_align = 'left' if angular_offset > 0 else ('right' if angular_offset < 0 else 'center')
         ax.text(adjusted_angle, label_distance, napkin_text,
-                ha=ha_align, va='center', fontsize=14, fontweight='500',
+                ha=ha_align, va='center', fontsize=14, fontfamily=FONT_FAMILY, fontweight='500',
                 color=COLORS['marine_blue'],
                 bbox=dict(boxstyle='round,pad=0.3', facecolor='white',
                           edgecolor=COLORS['marine_blue'], linewidth=1.2, alpha=0.85),
@@ -251,12 +256,20 @@ def generate_radar_chart(startup_metrics: dict, startup_name: str = "Startup"):
             napkin_text = f'{int(napkin_high["Gross Margin"])}%'
         ha_align = 'left' if angular_offset > 0 else ('right' if angular_offset < 0 else 'center')
         ax.text(adjusted_angle, label_distance, napkin_text,
-                ha=ha_align, va='center', fontsize=14, fontweight='500',
+                ha=ha_align, va='center', fontsize=14, fontfamily=FONT_FAMILY, fontweight='500',
                 color=COLORS['marine_blue'],
                 bbox=dict(boxstyle='round,pad=0.3', facecolor='white',
                           edgecolor=COLORS['marine_blue'], linewidth=1.2, alpha=0.85),
                 zorder=5)
 
+    # Envelope de incerteza (Monte Carlo), na mesma escala por métrica do gráfico
+    if envelope is not None:
+        envelope_low, envelope_high = (list(e) + [e[0]] for e in envelope)
+        ax.fill_between(angles, envelope_low, envelope_high, color=COLORS['turquoise'], alpha=0.18, zorder=3.5)
+        for envelope_line in (envelope_low, envelope_high):
+            ax.plot(angles, envelope_line, color=COLORS['turquoise'], linewidth=1.5,
+                    linestyle='--', alpha=0.6, zorder=3.5)
+
     # Série da startup (linha principal)
     ax.plot(angles, purple_plot, color=COLORS['turquoise'], linewidth=4.5, linestyle='-', zorder=4)
     ax.fill(angles, purple_plot, color=COLORS['turquoise'], alpha=0.25, zorder=3)
@@ -277,7 +290,7 @@ def generate_radar_chart(startup_metrics: dict, startup_name: str = "Startup"):
         else:
             label_text = f'{int(startup_metrics["Gross Margin"])}%'
         ax.text(angle, value, label_text, ha='center', va='center',
-                fontsize=15, fontweight='bold', color=COLORS['deep_ocean'],
+                fontsize=15, fontfamily=FONT_FAMILY, fontweight='bold', color=COLORS['deep_ocean'],
                 bbox=dict(boxstyle='round,pad=0.45', facecolor='white',
                           edgecolor=COLORS['turquoise'], linewidth=2.5, alpha=0.98),
                 zorder=6)
@@ -298,63 +311,60 @@ def generate_radar_chart(startup_metrics: dict, startup_name: str = "Startup"):
         else:
             ha, distance_mul = 'right', 1.13
         ax.text(angle, 100 * distance_mul, label, ha=ha, va='center',
-                fontsize=18, fontweight='bold', color=COLORS['deep_ocean'], linespacing=1.3)
+                fontsize=18, fontfamily=FONT_FAMILY, fontweight='bold', color=COLORS['deep_ocean'], linespacing=1.3)
 
     ax.spines['polar'].set_visible(False)
 
     # Legenda e rodapé
     legend_y = 0.09
     legend_x_start = 0.18
-    fig.patches.append(plt.Rectangle((legend_x_start, legend_y), 0.025, 0.012,
+    fig.patches.append(Rectangle((legend_x_start, legend_y), 0.025, 0.012,
                                      transform=fig.transFigure, facecolor=COLORS['turquoise'],
                                      edgecolor='white', linewidth=2.5))
     fig.text(legend_x_start + 0.035, legend_y + 0.006, f'{startup_name} Metrics',
-             transform=fig.transFigure, fontsize=16, fontweight='700',
+             transform=fig.transFigure, fontsize=16, fontfamily=FONT_FAMILY, fontweight='700',
              color=COLORS['deep_ocean'], va='center')
 
     napkin_low_x = legend_x_start + 0.20
-    fig.patches.append(plt.Rectangle((napkin_low_x, legend_y), 0.025, 0.012,
+    fig.patches.append(Rectangle((napkin_low_x, legend_y), 0.025, 0.012,
                                      transform=fig.transFigure, facecolor=COLORS['marine_blue'],
                                      edgecolor='white', linewidth=1.2, alpha=0.35))
     fig.text(napkin_low_x + 0.035, legend_y + 0.006, 'Napkin Low',
-             transform=fig.transFigure, fontsize=16, fontweight='700',
+             transform=fig.transFigure, fontsize=16, fontfamily=FONT_FAMILY, fontweight='700',
              color=COLORS['deep_ocean'], va='center')
 
     napkin_high_x = legend_x_start + 0.35
-    fig.patches.append(plt.Rectangle((napkin_high_x, legend_y), 0.025, 0.012,
+    fig.patches.append(Rectangle((napkin_high_x, legend_y), 0.025, 0.012,
                                      transform=fig.transFigure, facecolor=COLORS['marine_blue'],
                                      edgecolor='white', linewidth=1.2, alpha=0.35))
     fig.text(napkin_high_x + 0.035, legend_y + 0.006, 'Napkin High',
-             transform=fig.transFigure, fontsize=16, fontweight='700',
+             transform=fig.transFigure, fontsize=16, fontfamily=FONT_FAMILY, fontweight='700',
              color=COLORS['deep_ocean'], va='center')
 
-    # Nota de rodapé dinâmica conforme estágio selecionado (sem f-strings aninhadas)
-    growth_suffix = "" if napkin_low["Growth"] == napkin_high["Growth"] else ("-" + str(int(napkin_high["Growth"])) + "%")
-    cap_suffix = "" if napkin_low["Cap Table"] == napkin_high["Cap Table"] else ("-" + str(int(napkin_high["Cap Table"])) + "%")
-    gm_low = int(napkin_low.get("Gross Margin", 70))
-    gm_high = int(napkin_high.get("Gross Margin", 70))
-    gm_suffix = "" if gm_low == gm_high else ("-" + str(gm_high) + "%")
-    footnote_text = (
-        f"Napkin Benchmark: ARR ${napkin_low['ARR']}M-${napkin_high['ARR']}M | "
-        f"Growth {int(napkin_low['Growth'])}%{growth_suffix} | "
-        f"Round ${napkin_low['Round Size']}M-${napkin_high['Round Size']}M | "
-        f"Valuation ${napkin_low['Valuation']}M-${napkin_high['Valuation']}M | "
-        f"Cap Table {int(napkin_low['Cap Table'])}%{cap_suffix} | "
-        f"Gross Margin {gm_low}%{gm_suffix}"
-    )
-    fig.text(0.5, 0.04, footnote_text, ha='center', va='center', fontsize=13.5,
+    # Nota de rodapé dinâmica conforme estágio selecionado e versão do benchmark
+    footnote = footnote_text(napkin_low, napkin_high, version=benchmark_version)
+    fig.text(0.5, 0.04, footnote, ha='center', va='center', fontsize=13.5, fontfamily=FONT_FAMILY,
              color=COLORS['marine_blue'], style='italic', transform=fig.transFigure)
 
-    plt.subplots_adjust(left=0.1, right=0.9, top=0.93, bottom=0.20)
+    fig.subplots_adjust(left=0.1, right=0.9, top=0.93, bottom=0.20)
+
+    return fig
+
 
-    # Buffer de imagem para download
-    buffer = io.BytesIO()
-    fig.savefig(buffer, format='png', dpi=300, bbox_inches='tight', facecolor='white',
-                edgecolor='none', pad_inches=0.3)
-    buffer.seek(0)
+def generate_radar_chart(startup_metrics: dict, startup_name: str = "Startup", benchmark_version: str | None = None,
+                         envelope: tuple | None = None):
+    fig = build_radar_figure(startup_metrics, napkin_low, napkin_high, startup_name=startup_name,
+                             benchmark_version=benchmark_version, envelope=envelope)
+    # Buffer de imagem para download (rasterização no executor limitado e compartilhado)
+    buffer = io.BytesIO(render_executor().submit(figure_to_png, fig).result())
     return fig, buffer
 
 
+def radar_png(startup_metrics: dict, napkin_low: dict, napkin_high: dict, dpi: int = 300, **kwargs) -> bytes:
+    # Monta e rasteriza numa única tarefa, para rodar inteira dentro do executor (geração em lote)
+    return figure_to_png(build_radar_figure(startup_metrics, napkin_low, napkin_high, **kwargs), dpi=dpi)
+
+
 # -------------------------------
 # Interface Streamlit
 # -------------------------------
@@ -370,21 +380,68 @@ st.markdown(
     """,
     unsafe_allow_html=True,
 )
-stage = st.selectbox("Estágio da rodada", options=["Seed", "Pre-Seed", "Series A", "Series B"], index=0, label_visibility="collapsed")
-selected_bench = NAPKIN_BENCHMARKS[stage]
+DEFAULT_INPUTS = {
+    'ARR': 1.1,
+    'Growth': 389.0,
+    'Round Size': 3.5,
+    'Valuation': 13.0,
+    'Cap Table': 72.0,
+    'Gross Margin': 82.0,
+}
+STAGE_OPTIONS = ["Seed", "Pre-Seed", "Series A", "Series B"]
+
+# Modo lote: gráficos exibidos assim que prontos e tamanho da janela de renderização em paralelo
+BULK_PREVIEW_COUNT = 3
+BULK_WINDOW = 8
+# O download_button carrega o arquivo inteiro na memória da sessão; por isso o lote é dividido
+# em partes de até BULK_ZIP_PART gráficos e só a parte escolhida é oferecida para download
+BULK_ZIP_PART = 50
+
+
+def unique_name(name: str, used: set) -> str:
+    """Nome livre no ZIP: acrescenta _1, _2, ... até não colidir com nenhum já usado."""
+    stem, ext = os.path.splitext(name)
+    candidate, k = name, 1
+    while candidate in used:
+        candidate, k = f"{stem}_{k}{ext}", k + 1
+    return candidate
+
+# Benchmarks vigentes na data da rodada (histórico versionado)
+round_date = st.date_input("Data da rodada", value=date.today(), format="DD/MM/YYYY")
+stage_benchmarks = benchmarks_at(round_date)
+
+# Sugestão de estágio a partir dos valores atuais (session_state já traz a última edição)
+current_inputs = {m: float(st.session_state.get(f"input_{m}", v)) for m, v in DEFAULT_INPUTS.items()}
+suggested_stage, stage_scores = best_fit_stage(current_inputs, stage_benchmarks)
+
+auto_stage = st.toggle("Detectar estágio automaticamente", value=True)
+# Em modo automático o seletor acompanha a sugestão; ao desligar, parte do último estágio sugerido
+if auto_stage or "stage_select" not in st.session_state:
+    st.session_state["stage_select"] = suggested_stage
+stage = st.selectbox(
+    "Estágio da rodada",
+    options=STAGE_OPTIONS,
+    key="stage_select",
+    disabled=auto_stage,
+    label_visibility="collapsed",
+)
+st.caption(" | ".join(
+    f"{s}: {stage_scores[s]['confidence']:.0%} (dist. {stage_scores[s]['distance']:.1f})" for s in STAGE_OPTIONS
+))
+selected_bench = stage_benchmarks[stage]
 napkin_low = selected_bench['low']
 napkin_high = selected_bench['high']
 
 c1, c2, c3 = st.columns(3)
 with c1:
-    arr = st.number_input("ARR (em milhões de USD)", min_value=0.0, step=0.1, value=1.1)
-    round_size = st.number_input("Round Size (em milhões de USD)", min_value=0.0, step=0.1, value=3.5)
+    arr = st.number_input("ARR (em milhões de USD)", min_value=0.0, step=0.1, value=DEFAULT_INPUTS['ARR'], key="input_ARR")
+    round_size = st.number_input("Round Size (em milhões de USD)", min_value=0.0, step=0.1, value=DEFAULT_INPUTS['Round Size'], key="input_Round Size")
 with c2:
-    growth = st.number_input("Growth (%)", min_value=0.0, step=10.0, value=389.0)
-    valuation = st.number_input("Valuation (em milhões de USD)", min_value=0.0, step=0.5, value=13.0)
+    growth = st.number_input("Growth (%)", min_value=0.0, step=10.0, value=DEFAULT_INPUTS['Growth'], key="input_Growth")
+    valuation = st.number_input("Valuation (em milhões de USD)", min_value=0.0, step=0.5, value=DEFAULT_INPUTS['Valuation'], key="input_Valuation")
 with c3:
-    cap_table = st.number_input("Cap Table (%)", min_value=0.0, max_value=100.0, step=1.0, value=72.0)
-    gross_margin = st.number_input("Gross Margin (%)", min_value=0.0, max_value=100.0, step=1.0, value=82.0)
+    cap_table = st.number_input("Cap Table (%)", min_value=0.0, max_value=100.0, step=1.0, value=DEFAULT_INPUTS['Cap Table'], key="input_Cap Table")
+    gross_margin = st.number_input("Gross Margin (%)", min_value=0.0, max_value=100.0, step=1.0, value=DEFAULT_INPUTS['Gross Margin'], key="input_Gross Margin")
 
 # Gera o gráfico automaticamente (tempo real) a cada alteração
 startup_metrics = {
@@ -396,11 +453,46 @@ startup_metrics = {
     'Gross Margin': float(gross_margin),
 }
 
-fig, buffer = generate_radar_chart(startup_metrics, startup_name="Startup")
-
-tab1, tab2 = st.tabs(["Gráfico", "Dados"])
+# Modo incerteza: faixas (mín-máx) por métrica, amostradas via Monte Carlo
+uncertainty = st.toggle("Faixas de incerteza (Monte Carlo)", value=False)
+metric_ranges = {}
+if uncertainty:
+    with st.expander("Faixas por métrica (mín-máx)", expanded=True):
+        for metric in metrics:
+            r1, r2 = st.columns(2)
+            # Faixa de ±10% do valor pontual, que acompanha o valor enquanto o usuário não editá-la
+            point = startup_metrics[metric]
+            seeded = (round(point * 0.9, 3), round(point * 1.1, 3))
+            min_key, max_key, seed_key = f"range_min_{metric}", f"range_max_{metric}", f"range_seed_{metric}"
+            current = (st.session_state.get(min_key), st.session_state.get(max_key))
+            if min_key not in st.session_state or current == st.session_state.get(seed_key):
+                st.session_state[min_key], st.session_state[max_key] = seeded
+                st.session_state[seed_key] = seeded
+            range_min = r1.number_input(f"{metric} mín", min_value=0.0, key=min_key)
+            range_max = r2.number_input(f"{metric} máx", min_value=0.0, key=max_key)
+            if not range_min <= point <= range_max:
+                st.warning(f"{metric}: valor pontual {point:g} fora da faixa {range_min:g}-{range_max:g}")
+            metric_ranges[metric] = (float(range_min), float(range_max))
+
+if metric_ranges:
+    # Envelope na mesma escala por métrica do gráfico (eixos definidos pelo valor pontual)
+    chart_axes = metric_axes(startup_metrics, napkin_low, napkin_high)
+    mc = simulate(metric_ranges, napkin_low, napkin_high, metric_order=metrics,
+                  normalize=lambda samples: normalize_per_metric_array(samples, chart_axes))
+else:
+    mc = None
+fig, buffer = generate_radar_chart(startup_metrics, startup_name="Startup", benchmark_version=selected_bench['version'],
+                                   envelope=mc['envelope'] if mc else None)
+
+tab1, tab2, tab3 = st.tabs(["Gráfico", "Dados", "Lote"])
 with tab1:
-    st.pyplot(fig, use_container_width=True)
+    # Exibe o próprio PNG já renderizado (evita um segundo savefig via st.pyplot)
+    st.image(buffer.getvalue(), use_container_width=True)
+    if mc is not None:
+        st.caption(
+            f"Faixa P{mc['percentiles'][0]}-P{mc['percentiles'][1]} de {mc['samples']:,} cenários "
+            f"(seed {mc['seed']}) em {mc['seconds'] * 1000:.0f} ms"
+        )
     st.download_button(
         label="Baixar gráfico (PNG)",
         data=buffer,
@@ -427,3 +519,84 @@ with tab2:
     )
 
 
+with tab3:
+    st.write(
+        "Envie um CSV com as colunas Startup, " + ", ".join(metrics)
+        + " e, opcionalmente, Stage e Round Date (sem estágio, usa o mais aderente)."
+    )
+    uploaded = st.file_uploader("CSV do portfólio", type="csv")
+    portfolio_rows = []
+    if uploaded is not None:
+        try:
+            portfolio_rows = read_portfolio(uploaded, metric_order=metrics)
+        except ValueError as exc:
+            st.error(str(exc))
+        # Resolve estágio e benchmark de todas as linhas antes de liberar a geração;
+        # linhas sem Round Date usam a data da rodada informada acima
+        resolved, invalid = [], []
+        for row in portfolio_rows:
+            try:
+                resolved.append(resolve_benchmark(row, default_date=round_date))
+            except (KeyError, ValueError) as exc:
+                invalid.append(f"{row['company']}: {exc}")
+        if invalid:
+            st.error("Linhas inválidas no CSV: " + "; ".join(invalid))
+            portfolio_rows = []
+    # Partes do ZIP de um CSV anterior não valem mais
+    bulk_zip = st.session_state.get("bulk_zip")
+    if bulk_zip and (uploaded is None or bulk_zip["source"] != uploaded.file_id):
+        shutil.rmtree(st.session_state.pop("bulk_zip")["dir"], ignore_errors=True)
+    if portfolio_rows and st.button(f"Gerar {len(portfolio_rows)} gráficos"):
+        progress = st.progress(0.0, text="Renderizando...")
+        preview_cols = st.columns(BULK_PREVIEW_COUNT)
+        if "bulk_zip" in st.session_state:
+            shutil.rmtree(st.session_state.pop("bulk_zip")["dir"], ignore_errors=True)
+        # ZIPs montados incrementalmente em disco: só BULK_WINDOW PNGs em memória por vez
+        zip_dir = tempfile.mkdtemp(prefix="napkin_radar_")
+        zip_parts = []
+        archive = None
+        in_flight = deque()
+        used_names = set()
+        done = 0
+        for i, (row, (_, row_bench)) in enumerate(zip(portfolio_rows, resolved)):
+            # Mesmo desenho e escala por métrica do gráfico individual
+            in_flight.append((row, render_executor().submit(
+                radar_png, row['metrics'], row_bench['low'], row_bench['high'], dpi=150,
+                startup_name=row['company'], benchmark_version=row_bench['version'],
+            )))
+            # Consome em ordem quando a janela enche (ou ao final) para manter a memória limitada
+            while in_flight and (len(in_flight) >= BULK_WINDOW or i == len(portfolio_rows) - 1):
+                done_row, future = in_flight.popleft()
+                png = future.result()
+                if done % BULK_ZIP_PART == 0:
+                    if archive is not None:
+                        archive.close()
+                    zip_parts.append(os.path.join(zip_dir, f"napkin_radar_portfolio_{len(zip_parts) + 1}.zip"))
+                    archive = zipfile.ZipFile(zip_parts[-1], "w", compression=zipfile.ZIP_STORED)
+                name = unique_name(output_name(done_row['company']), used_names)
+                used_names.add(name)
+                archive.writestr(name, png)
+                if done < BULK_PREVIEW_COUNT:
+                    preview_cols[done].image(png, caption=done_row['company'], use_container_width=True)
+                done += 1
+                progress.progress(done / len(portfolio_rows), text=f"{done}/{len(portfolio_rows)} gráficos")
+        archive.close()
+        st.session_state["bulk_zip"] = {"source": uploaded.file_id, "dir": zip_dir, "parts": zip_parts}
+
+    bulk_zip = st.session_state.get("bulk_zip")
+    if bulk_zip:
+        zip_parts = bulk_zip["parts"]
+        zip_path = zip_parts[0]
+        if len(zip_parts) > 1:
+            zip_path = st.selectbox(
+                f"Parte do ZIP (até {BULK_ZIP_PART} gráficos cada)",
+                zip_parts,
+                format_func=lambda path: f"Parte {zip_parts.index(path) + 1} de {len(zip_parts)}",
+            )
+        with open(zip_path, "rb") as zip_file:
+            st.download_button(
+                label="Baixar todos (ZIP)" if len(zip_parts) == 1 else "Baixar parte (ZIP)",
+                data=zip_file,
+                file_name=os.path.basename(zip_path),
+                mime="application/zip"
+            )
@@ -0,0 +1,169 @@
+"""
+Teste de carga headless do app.py: simula N sessões Streamlit simultâneas (via AppTest),
+cada uma alterando estágio e métricas em ritmo realista, e reporta vazão, latência de
+rerun (p50/p95/p99) e pico de memória para cada N.
+
+O AppTest mantém um Runtime global por processo, então cada sessão simulada roda em um
+processo próprio; a disputa por CPU é a mesma de um servidor com N sessões. A memória é
+reportada como o pico de RSS do maior processo e a soma dos picos (limite superior, pois
+um servidor real compartilha os módulos entre sessões).
+
+Num servidor real as N sessões dividem um único `render_executor()` com RENDER_WORKERS
+threads. Para não simular N x RENDER_WORKERS renderizações simultâneas, cada processo recebe
+max(1, RENDER_WORKERS // N) workers (coluna "workers"). Quando N > RENDER_WORKERS, cada
+sessão ainda fica com 1 worker e o total passa do limite compartilhado; nesse caso a
+disputa pelo executor é subestimada.
+
+Uso:
+    python loadtest.py --sessions 1,2,4,8 --duration 30 --think 1.0
+"""
+import argparse
+import multiprocessing as mp
+import random
+import resource
+import time
+from pathlib import Path
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+import napkin_plot
+from napkin_plot import NAPKIN_BENCHMARKS
+
+
+APP_PATH = str(Path(__file__).resolve().parent / "app.py")
+
+# Intervalos plausíveis por métrica para as edições simuladas
+METRIC_RANGES = {
+    "ARR": (0.0, 40.0),
+    "Growth": (0.0, 500.0),
+    "Round Size": (0.0, 30.0),
+    "Valuation": (0.0, 100.0),
+    "Cap Table": (0.0, 100.0),
+    "Gross Margin": (0.0, 100.0),
+}
+
+
+def _edit(at: AppTest, rng: random.Random) -> None:
+    """Aplica uma interação aleatória: trocar o estágio ou editar uma métrica."""
+    if rng.random() < 0.25:
+        auto = next(t for t in at.toggle if t.label == "Detectar estágio automaticamente")
+        if auto.value:
+            auto.set_value(False)
+        at.selectbox[0].set_value(rng.choice(list(NAPKIN_BENCHMARKS)))
+    else:
+        metric = rng.choice(list(METRIC_RANGES))
+        low, high = METRIC_RANGES[metric]
+        at.number_input(key=f"input_{metric}").set_value(round(rng.uniform(low, high), 2))
+
+
+def _session(
+    seed: int, barrier, duration: float, think: float, timeout: float, render_workers: int, results
+) -> None:
+    """
+    Uma sessão simulada (em processo próprio): execução inicial (fria) e, após a largada
+    comum, edições com tempo de reflexão exponencial até o fim de `duration`.
+    """
+    # Fatia do executor compartilhado (lido sob demanda por render_executor())
+    napkin_plot.RENDER_WORKERS = render_workers
+    rng = random.Random(seed)
+    cold = float("nan")
+    latencies: list[float] = []
+    errors: list[str] = []
+    elapsed = 0.0
+    try:
+        at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        start = time.perf_counter()
+        at.run()
+        cold = time.perf_counter() - start
+        barrier.wait()
+
+        loop_start = time.perf_counter()
+        deadline = loop_start + duration
+        while time.perf_counter() < deadline:
+            time.sleep(rng.expovariate(1 / think) if think > 0 else 0)
+            _edit(at, rng)
+            start = time.perf_counter()
+            at.run()
+            latencies.append(time.perf_counter() - start)
+            if at.exception:
+                errors.append(at.exception[0].message)
+        elapsed = time.perf_counter() - loop_start
+    except Exception as exc:  # noqa: BLE001 (falhas contam no relatório, não derrubam o teste)
+        errors.append(repr(exc))
+        barrier.abort()
+    results.put(
+        {
+            "cold": cold,
+            "latencies": latencies,
+            "errors": errors,
+            "elapsed": elapsed,
+            # ru_maxrss é em KiB no Linux
+            "peak_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        }
+    )
+
+
+def run_level(sessions: int, *, duration: float, think: float, timeout: float, seed: int = 0) -> dict:
+    """Executa `sessions` sessões em paralelo por `duration` segundos e agrega as métricas."""
+    ctx = mp.get_context("spawn")
+    barrier = ctx.Barrier(sessions)
+    results = ctx.Queue()
+    render_workers = max(1, napkin_plot.RENDER_WORKERS // sessions)
+    procs = [
+        ctx.Process(target=_session, args=(seed + i, barrier, duration, think, timeout, render_workers, results))
+        for i in range(sessions)
+    ]
+    for p in procs:
+        p.start()
+    reports = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+
+    latencies = [x for r in reports for x in r["latencies"]]
+    errors = [e for r in reports for e in r["errors"]]
+    elapsed = max(r["elapsed"] for r in reports) or float("nan")
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if latencies else (np.nan,) * 3
+    return {
+        "sessions": sessions,
+        "render_workers": render_workers,
+        "reruns": len(latencies),
+        "throughput": len(latencies) / elapsed,
+        "cold": float(np.nanmedian([r["cold"] for r in reports])),
+        "p50": p50,
+        "p95": p95,
+        "p99": p99,
+        "peak_rss_mb": max(r["peak_rss"] for r in reports) / 2**20,
+        "total_rss_mb": sum(r["peak_rss"] for r in reports) / 2**20,
+        "errors": len(errors),
+        "first_error": errors[0] if errors else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Teste de carga headless do app Napkin Radar")
+    parser.add_argument("--sessions", default="1,2,4,8", help="níveis de sessões simultâneas (ex.: 1,2,4,8)")
+    parser.add_argument("--duration", type=float, default=30.0, help="segundos por nível")
+    parser.add_argument("--think", type=float, default=1.0, help="tempo médio de reflexão entre edições (s)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="timeout de cada rerun (s)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"Executor de renderização: {napkin_plot.RENDER_WORKERS} workers divididos entre as sessões")
+    print(
+        f"{'N':>4} {'workers':>7} {'reruns':>7} {'rerun/s':>8} {'fria ms':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+        f"{'pico MB':>8} {'soma MB':>8} {'erros':>6}"
+    )
+    for n in (int(x) for x in args.sessions.split(",")):
+        r = run_level(n, duration=args.duration, think=args.think, timeout=args.timeout, seed=args.seed)
+        print(
+            f"{r['sessions']:>4} {r['render_workers']:>7} {r['reruns']:>7} {r['throughput']:>8.2f} {r['cold'] * 1000:>8.0f} "
+            f"{r['p50'] * 1000:>8.0f} {r['p95'] * 1000:>8.0f} {r['p99'] * 1000:>8.0f} "
+            f"{r['peak_rss_mb']:>8.0f} {r['total_rss_mb']:>8.0f} {r['errors']:>6}"
+        )
+        if r["first_error"]:
+            print(f"     primeiro erro: {r['first_error']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+from bisect import bisect_right
+from datetime import date, datetime
+
+import numpy as np
+
+from napkin_plot import DEFAULT_METRIC_ORDER, NAPKIN_BENCHMARKS, normalize_array
+
+
+# Histórico versionado dos benchmarks: por estágio, versões ordenadas pela data de vigência
+# (effective_from). Cada versão vale de effective_from até a véspera da próxima do mesmo estágio.
+# A versão "v1" é o snapshot original de NAPKIN_BENCHMARKS, vigente desde sempre.
+NAPKIN_HISTORY = {
+    stage: [{"version": "v1", "effective_from": date.min, "low": bench["low"], "high": bench["high"]}]
+    for stage, bench in NAPKIN_BENCHMARKS.items()
+}
+
+# Chave do índice plano: estágio * _STAGE_SPAN + (dias desde 1970 + _DAY_OFFSET)
+_DAY_OFFSET = 1 << 31
+_STAGE_SPAN = 1 << 32
+
+
+def _to_days(when) -> np.ndarray:
+    """Converte data(s) (date, str ISO ou datetime64) em dias inteiros desde 1970-01-01."""
+    return np.asarray(when, dtype="datetime64[D]").astype(np.int64)
+
+
+def add_version(
+    stage: str,
+    effective_from: date,
+    version: str,
+    low: dict,
+    high: dict,
+    history: dict | None = None,
+) -> None:
+    """Registra uma nova versão de benchmark para o estágio, mantendo a ordem por vigência."""
+    history = NAPKIN_HISTORY if history is None else history
+    versions = history.setdefault(stage, [])
+    if any(v["effective_from"] == effective_from for v in versions):
+        raise ValueError(f"{stage} já tem uma versão vigente a partir de {effective_from}")
+    entry = {"version": version, "effective_from": effective_from, "low": low, "high": high}
+    versions.insert(bisect_right(versions, effective_from, key=lambda v: v["effective_from"]), entry)
+
+
+def benchmark_at(stage: str, when: date, history: dict | None = None) -> dict:
+    """
+    Retorna a versão {'version', 'effective_from', 'low', 'high'} do estágio vigente em `when`.
+    """
+    versions = (NAPKIN_HISTORY if history is None else history)[stage]
+    if isinstance(when, datetime):
+        when = when.date()
+    i = bisect_right(versions, when, key=lambda v: v["effective_from"])
+    if i == 0:
+        raise ValueError(f"Nenhum benchmark de {stage} vigente em {when}")
+    return versions[i - 1]
+
+
+def benchmarks_at(when: date, history: dict | None = None) -> dict:
+    """Snapshot no formato de NAPKIN_BENCHMARKS com a versão vigente de cada estágio em `when`."""
+    history = NAPKIN_HISTORY if history is None else history
+    return {stage: benchmark_at(stage, when, history) for stage in history}
+
+
+def _history_table(history: dict, order: list) -> tuple:
+    """
+    Achata o histórico num índice ordenado por (estágio, vigência). Retorna
+    (estágios, chaves[V], estágio[V], versão[V], low[V, M], high[V, M]).
+    """
+    stage_names = list(history)
+    entries = [(i, v) for i, s in enumerate(stage_names) for v in history[s]]
+    keys = np.array(
+        [i * _STAGE_SPAN + _to_days(v["effective_from"]) + _DAY_OFFSET for i, v in entries], dtype=np.int64
+    )
+    table_stage = np.array([i for i, _ in entries], dtype=np.int64)
+    table_version = np.array([v["version"] for _, v in entries])
+    table_low = np.array([[v["low"][m] for m in order] for _, v in entries], dtype=float)
+    table_high = np.array([[v["high"][m] for m in order] for _, v in entries], dtype=float)
+    return stage_names, keys, table_stage, table_version, table_low, table_high
+
+
+def _lookup(keys: np.ndarray, table_stage: np.ndarray, row_stage: np.ndarray, days, stage_names: list) -> np.ndarray:
+    """Posição no índice da última versão com vigência <= data para cada par (estágio, data)."""
+    row_keys = row_stage * _STAGE_SPAN + days + _DAY_OFFSET
+    row_stage = np.broadcast_to(row_stage, row_keys.shape)
+    pos = np.searchsorted(keys, row_keys, side="right") - 1
+    missing = (pos < 0) | (table_stage[np.maximum(pos, 0)] != row_stage)
+    if missing.any():
+        first = np.unravel_index(int(np.argmax(missing)), missing.shape)
+        raise ValueError(f"Nenhum benchmark de {stage_names[row_stage[first]]} vigente na linha {first[0]}")
+    return pos
+
+
+def resolve_benchmarks(
+    stages,
+    dates,
+    history: dict | None = None,
+    *,
+    metric_order: list | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Resolve, em uma única busca vetorizada, a versão vigente para cada par (estágio, data).
+
+    O histórico é achatado num índice ordenado por (estágio, vigência); cada linha vira uma
+    chave do mesmo tipo e `np.searchsorted` encontra a última versão com vigência <= data.
+    Retorna (versões[N], low[N, M], high[N, M]).
+    """
+    history = NAPKIN_HISTORY if history is None else history
+    order = metric_order or DEFAULT_METRIC_ORDER
+    stage_names, keys, table_stage, table_version, table_low, table_high = _history_table(history, order)
+    stage_index = {stage: i for i, stage in enumerate(stage_names)}
+
+    # Mapeia estágio -> índice só para os valores distintos; as linhas herdam via return_inverse
+    unique_stages, inverse = np.unique(np.atleast_1d(np.asarray(stages, dtype=str)), return_inverse=True)
+    unknown = [s for s in unique_stages.tolist() if s not in stage_index]
+    if unknown:
+        raise KeyError(f"Estágio sem histórico de benchmark: {', '.join(unknown)}")
+    row_stage = np.array([stage_index[s] for s in unique_stages.tolist()], dtype=np.int64)[inverse.ravel()]
+
+    pos = _lookup(keys, table_stage, row_stage, _to_days(dates), stage_names)
+    return table_version[pos], table_low[pos], table_high[pos]
+
+
+def resolve_stage_bands(
+    dates,
+    history: dict | None = None,
+    *,
+    metric_order: list | None = None,
+) -> tuple[list, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Faixas de todos os estágios vigentes em cada data, numa única busca sobre os pares
+    (data, estágio). Retorna (estágios[S], versões[N, S], low[N, S, M], high[N, S, M]).
+    """
+    history = NAPKIN_HISTORY if history is None else history
+    order = metric_order or DEFAULT_METRIC_ORDER
+    stage_names, keys, table_stage, table_version, table_low, table_high = _history_table(history, order)
+
+    days = np.atleast_1d(_to_days(dates))[:, None]  # (N, 1) contra (S,) -> (N, S)
+    pos = _lookup(keys, table_stage, np.arange(len(stage_names), dtype=np.int64), days, stage_names)
+    return stage_names, table_version[pos], table_low[pos], table_high[pos]
+
+
+def normalize_rounds(
+    values,
+    stages,
+    dates,
+    history: dict | None = None,
+    *,
+    metric_order: list | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Normaliza rodadas históricas (values[N, M]) cada uma contra o benchmark vigente na sua data.
+    Retorna (normalizados[N, M], versões[N]).
+    """
+    versions, low, high = resolve_benchmarks(stages, dates, history, metric_order=metric_order)
+    return normalize_array(np.asarray(values, dtype=float), low, high), versions
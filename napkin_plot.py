@@ -1,7 +1,14 @@
+import io
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib import font_manager
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
 from matplotlib.patches import Circle  # kept for potential future use
+from matplotlib.patches import Rectangle
 
 
 # Astella Brand Colors (Complete Palette)
@@ -18,9 +25,11 @@ COLORS = {
     "peach": "#F3AF8A",           # Warm accents, success states
 }
 
-# Typography preferences (non-failing, will fallback if fonts not available)
-plt.rcParams["font.family"] = "sans-serif"
-plt.rcParams["font.sans-serif"] = [
+# Typography preferences (non-failing, will fallback if fonts not available).
+# Passada por chamada (fontfamily=...) em vez de rcParams globais, que não são thread-safe.
+# A lista mantém o fallback por glifo do matplotlib; só as famílias ausentes são filtradas
+# (uma vez, no import), para não repetir avisos do findfont a cada texto.
+FONT_PREFERENCES = [
     "Open Sans",
     "Intelo",
     "Montserrat",
@@ -28,6 +37,8 @@ plt.rcParams["font.sans-serif"] = [
     "Helvetica",
     "DejaVu Sans",
 ]
+_installed_fonts = {f.name for f in font_manager.fontManager.ttflist}
+FONT_FAMILY = [name for name in FONT_PREFERENCES if name in _installed_fonts] + ["sans-serif"]
 
 
 def _normalize_value(
@@ -92,9 +103,149 @@ def _check_label_overlap(purple_value: float, napkin_value: float, threshold: fl
     return 0, 0, None
 
 
+def normalize_array(values, low, high) -> np.ndarray:
+    """
+    Versão vetorizada de `_normalize_value` (modo higher_better) com broadcasting NumPy.
+    `values`, `low` e `high` podem ter qualquer forma compatível; retorna valores em [0, 100].
+    """
+    values, low, high = np.broadcast_arrays(
+        np.asarray(values, dtype=float), np.asarray(low, dtype=float), np.asarray(high, dtype=float)
+    )
+    # Caso low==high: ancorar a 0 para evitar distorção (ex.: percentuais)
+    low = np.where(low == high, 0.0, low)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        over = 80 + 20 * (np.log1p(values / high - 1) / np.log1p(9))
+        anchored = np.where(values <= 0, 40.0, np.where(values <= high, 40 + 40 * (values / high), over))
+        below = 40 + 20 * (np.maximum(values, 0.0) / low)
+        inside = 60 + 20 * ((values - low) / (high - low))
+        banded = np.where(values <= low, below, np.where(values < high, inside, over))
+        out = np.where(low <= 0, anchored, banded)
+        out = np.where(high <= 0, np.where(values > 0, 100.0, 40.0), out)
+    return np.minimum(out, 100.0)
+
+
 DEFAULT_METRIC_ORDER = ["ARR", "Growth", "Round Size", "Cap Table", "Valuation", "Gross Margin"]
 
 
+# Benchmarks do Napkin por estágio
+NAPKIN_BENCHMARKS = {
+    "Pre-Seed": {
+        "low": {"ARR": 0.0, "Growth": 0, "Round Size": 0.460, "Valuation": 2.750, "Cap Table": 90, "Gross Margin": 70},
+        "high": {"ARR": 0.180, "Growth": 0, "Round Size": 0.920, "Valuation": 6.410, "Cap Table": 90, "Gross Margin": 70},
+    },
+    "Seed": {
+        "low": {"ARR": 0.64, "Growth": 200, "Round Size": 1.46, "Valuation": 5.86, "Cap Table": 80, "Gross Margin": 70},
+        "high": {"ARR": 1.83, "Growth": 200, "Round Size": 3.66, "Valuation": 10.9, "Cap Table": 80, "Gross Margin": 70},
+    },
+    "Series A": {
+        "low": {"ARR": 3.300, "Growth": 150, "Round Size": 4.580, "Valuation": 13.730, "Cap Table": 65, "Gross Margin": 70},
+        "high": {"ARR": 5.490, "Growth": 150, "Round Size": 9.150, "Valuation": 36.620, "Cap Table": 65, "Gross Margin": 70},
+    },
+    "Series B": {
+        "low": {"ARR": 9.150, "Growth": 100, "Round Size": 13.730, "Valuation": 45.700, "Cap Table": 50, "Gross Margin": 70},
+        "high": {"ARR": 36.620, "Growth": 100, "Round Size": 27.450, "Valuation": 91.550, "Cap Table": 50, "Gross Margin": 70},
+    },
+}
+
+# Temperatura (em pontos da escala 0-100) usada para converter distâncias em confiança
+STAGE_CONFIDENCE_TEMPERATURE = 5.0
+
+
+def _benchmark_arrays(benchmarks: dict, order: list) -> tuple[list, np.ndarray, np.ndarray]:
+    """Converte {estágio: {'low': {...}, 'high': {...}}} em (estágios, low[S, M], high[S, M])."""
+    stages = list(benchmarks)
+    low = np.array([[benchmarks[s]["low"][m] for m in order] for s in stages], dtype=float)
+    high = np.array([[benchmarks[s]["high"][m] for m in order] for s in stages], dtype=float)
+    return stages, low, high
+
+
+def stage_distances(values, low: np.ndarray, high: np.ndarray) -> np.ndarray:
+    """
+    Distância RMS (escala 0-100) de values[N, M] até as faixas low/high de cada estágio.
+    As faixas têm forma (S, M), comum a todas as linhas, ou (N, S, M), uma por linha
+    (ex.: versão do benchmark vigente na data de cada rodada). Retorna distâncias[N, S].
+    """
+    x = np.atleast_2d(np.asarray(values, dtype=float))
+
+    # (N, 1, M) contra (S, M) ou (N, S, M) -> (N, S, M)
+    norm = normalize_array(x[:, None, :], low, high)
+    band_low = normalize_array(low, low, high)
+    band_high = normalize_array(high, low, high)
+    gap = np.maximum(band_low - norm, 0.0) + np.maximum(norm - band_high, 0.0)
+
+    weight = (high > 0).astype(float)
+    return np.sqrt((gap**2 * weight).sum(axis=-1) / np.maximum(weight.sum(axis=-1), 1.0))
+
+
+def score_stages(
+    values,
+    benchmarks: dict | None = None,
+    *,
+    metric_order: list | None = None,
+) -> tuple[list, np.ndarray, np.ndarray]:
+    """
+    Pontua uma ou várias startups contra todos os estágios de uma vez.
+
+    `values` tem forma (M,) ou (N, M), com as métricas na ordem de `metric_order`.
+    A distância de cada estágio é a RMS, na escala normalizada 0-100, do quanto cada métrica
+    fica fora da faixa Napkin daquele estágio (0 = todas dentro da faixa). Métricas sem
+    benchmark (high <= 0, ex.: Growth Pre-Seed) são ignoradas.
+    Retorna (estágios, distâncias[N, S], confiança[N, S]); a confiança soma 1 por linha.
+    """
+    order = metric_order or DEFAULT_METRIC_ORDER
+    stages, low, high = _benchmark_arrays(benchmarks or NAPKIN_BENCHMARKS, order)
+    distances = stage_distances(values, low, high)
+
+    logits = -distances / STAGE_CONFIDENCE_TEMPERATURE
+    logits -= logits.max(axis=-1, keepdims=True)
+    confidence = np.exp(logits)
+    confidence /= confidence.sum(axis=-1, keepdims=True)
+    return stages, distances, confidence
+
+
+def best_fit_stage(
+    startup_metrics: dict,
+    benchmarks: dict | None = None,
+    *,
+    metric_order: list | None = None,
+) -> tuple[str, dict]:
+    """
+    Retorna o estágio mais aderente às métricas e, por estágio, {'distance', 'confidence'}.
+    """
+    order = metric_order or DEFAULT_METRIC_ORDER
+    stages, distances, confidence = score_stages(
+        [startup_metrics[m] for m in order], benchmarks, metric_order=order
+    )
+    best = stages[int(np.argmin(distances[0]))]
+    scores = {
+        stage: {"distance": float(distances[0, i]), "confidence": float(confidence[0, i])}
+        for i, stage in enumerate(stages)
+    }
+    return best, scores
+
+
+def footnote_text(napkin_low: dict, napkin_high: dict, *, version: str | None = None) -> str:
+    """Nota de rodapé com a faixa Napkin do estágio (e a versão do benchmark, se informada)."""
+    growth_suffix = "" if napkin_low["Growth"] == napkin_high["Growth"] else ("-" + str(int(napkin_high["Growth"])) + "%")
+    cap_suffix = "" if napkin_low["Cap Table"] == napkin_high["Cap Table"] else ("-" + str(int(napkin_high["Cap Table"])) + "%")
+    gm_low = int(napkin_low.get("Gross Margin", 70))
+    gm_high = int(napkin_high.get("Gross Margin", 70))
+    gm_suffix = "" if gm_low == gm_high else ("-" + str(gm_high) + "%")
+    title = "Napkin Benchmark" if version is None else f"Napkin Benchmark ({version})"
+    return (
+        f"{title}: ARR ${napkin_low['ARR']}M-${napkin_high['ARR']}M | "
+        f"Growth {int(napkin_low['Growth'])}%{growth_suffix} | "
+        f"Round ${napkin_low['Round Size']}M-${napkin_high['Round Size']}M | "
+        f"Valuation ${napkin_low['Valuation']}M-${napkin_high['Valuation']}M | "
+        f"Cap Table {int(napkin_low['Cap Table'])}%{cap_suffix} | "
+        f"Gross Margin {gm_low}%{gm_suffix}"
+    )
+
+
+LAYERS = ("all", "background", "startup")
+
+
 def build_figure(
     startup_metrics: dict,
     napkin_low: dict,
@@ -102,11 +253,28 @@ def build_figure(
     *,
     metric_order: list | None = None,
     startup_name: str = "Startup",
+    layer: str = "all",
+    benchmark_version: str | None = None,
+    envelope: tuple | None = None,
 ) -> Figure:
     """
     Constrói e retorna a Figure do gráfico radar no tema Astella.
     Espera dicionários com chaves: 'ARR', 'Growth', 'Round Size', 'Valuation', 'Cap Table', 'Gross Margin'
+
+    `layer` permite gerar só parte do gráfico (usado pelo pipeline raster de `napkin_raster`):
+    - "all": gráfico completo;
+    - "background": grade, círculo externo, faixa Napkin, títulos dos eixos, legenda e rodapé,
+      que só dependem do estágio;
+    - "startup": fundo transparente com polígono, pontos e labels da startup, labels da faixa
+      (posicionados conforme os valores da startup) e o nome na legenda.
+    `benchmark_version` (ver `napkin_history`) é informado no rodapé quando presente.
+    `envelope` = (inferior, superior), valores já normalizados na ordem de `metric_order`,
+    desenha uma faixa de confiança em volta do polígono da startup.
     """
+    if layer not in LAYERS:
+        raise ValueError(f"layer deve ser um de {LAYERS}, recebido: {layer!r}")
+    draw_background = layer in ("all", "background")
+    draw_startup = layer in ("all", "startup")
     order = metric_order or DEFAULT_METRIC_ORDER
 
     # Normalização
@@ -143,8 +311,14 @@ def build_figure(
         napkin_high_normalized.append(min(100, h_val))
 
     # Figura
-    fig = plt.figure(figsize=(14, 14), facecolor="white")
-    ax = fig.add_subplot(111, projection="polar", facecolor="white")
+    # API orientada a objetos (sem pyplot): cada chamada tem sua própria Figure/canvas
+    # A camada "startup" é transparente para ser composta sobre a camada de fundo
+    facecolor = "none" if layer == "startup" else "white"
+    fig = Figure(figsize=(14, 14), facecolor=facecolor)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111, projection="polar", facecolor=facecolor)
+    if layer == "startup":
+        ax.set_axis_off()
 
     num_vars = len(order)
     angles = np.linspace(0, 2 * np.pi, num_vars, endpoint=False).tolist()
@@ -157,289 +331,370 @@ def build_figure(
     ax.set_ylim(0, 100)
     ax.set_theta_offset(np.pi / 2)
     ax.set_theta_direction(-1)
-    ax.set_yticklabels([])
-    ax.grid(True, color="#E0E0E0", linestyle="-", linewidth=1.2, alpha=0.6)
-
-    # Linha externa mais visível
-    theta_circle = np.linspace(0, 2 * np.pi, 200)
-    r_circle = np.full_like(theta_circle, 100)
-    ax.plot(theta_circle, r_circle, color="#C0C0C0", linewidth=2.5, alpha=0.7, zorder=1)
-
-    # Faixa de benchmark
-    ax.fill_between(
-        angles, napkin_low_plot, napkin_high_plot, color=COLORS["marine_blue"], alpha=0.15, zorder=1
-    )
-
-    # Linhas Low/High
-    ax.plot(
-        angles,
-        napkin_low_plot,
-        color=COLORS["marine_blue"],
-        linewidth=1.8,
-        linestyle=":",
-        alpha=0.5,
-        zorder=2,
-    )
-    ax.plot(
-        angles,
-        napkin_high_plot,
-        color=COLORS["marine_blue"],
-        linewidth=1.8,
-        linestyle=":",
-        alpha=0.5,
-        zorder=2,
-    )
-
-    # Labels Low
-    for i, (angle, value, metric) in enumerate(zip(angles[:-1], napkin_low_normalized, order)):
-        purple_value = purple_normalized[i]
-        radial_offset, angular_offset, direction = _check_label_overlap(purple_value, value)
-        if radial_offset > 0:
-            label_distance = max(0, value - radial_offset) if direction == "down" else min(100, value + radial_offset)
-        else:
-            label_distance = value
-        adjusted_angle = angle + angular_offset
-
-        if metric == "ARR":
-            napkin_text = f'${napkin_low["ARR"]}M'
-        elif metric == "Growth":
-            napkin_text = f'{int(napkin_low["Growth"])}%'
-        elif metric == "Round Size":
-            napkin_text = f'${napkin_low["Round Size"]}M'
-        elif metric == "Valuation":
-            napkin_text = f'${napkin_low["Valuation"]}M'
-        elif metric == "Cap Table":
-            napkin_text = f'{int(napkin_low["Cap Table"])}%'
-        else:
-            napkin_text = f'{int(napkin_low["Gross Margin"])}%'
-
-        ha_align = "left" if angular_offset > 0 else ("right" if angular_offset < 0 else "center")
-        ax.text(
-            adjusted_angle,
-            label_distance,
-            napkin_text,
-            ha=ha_align,
-            va="center",
-            fontsize=14,
-            fontweight="500",
-            color=COLORS["marine_blue"],
-            bbox=dict(
-                boxstyle="round,pad=0.3",
-                facecolor="white",
-                edgecolor=COLORS["marine_blue"],
-                linewidth=1.2,
-                alpha=0.85,
-            ),
-            zorder=5,
+    if draw_background:
+        ax.set_yticklabels([])
+        ax.grid(True, color="#E0E0E0", linestyle="-", linewidth=1.2, alpha=0.6)
+
+        # Linha externa mais visível
+        theta_circle = np.linspace(0, 2 * np.pi, 200)
+        r_circle = np.full_like(theta_circle, 100)
+        ax.plot(theta_circle, r_circle, color="#C0C0C0", linewidth=2.5, alpha=0.7, zorder=1)
+
+        # Faixa de benchmark
+        ax.fill_between(
+            angles, napkin_low_plot, napkin_high_plot, color=COLORS["marine_blue"], alpha=0.15, zorder=1
         )
 
-    # Labels High
-    for i, (angle, value, metric) in enumerate(zip(angles[:-1], napkin_high_normalized, order)):
-        purple_value = purple_normalized[i]
-        radial_offset, angular_offset, direction = _check_label_overlap(purple_value, value)
-        if radial_offset > 0:
-            label_distance = max(0, value - radial_offset) if direction == "down" else min(100, value + radial_offset)
-        else:
-            label_distance = value
-        adjusted_angle = angle + angular_offset
-
-        if metric == "ARR":
-            napkin_text = f'${napkin_high["ARR"]}M'
-        elif metric == "Growth":
-            napkin_text = f'{int(napkin_high["Growth"])}%'
-        elif metric == "Round Size":
-            napkin_text = f'${napkin_high["Round Size"]}M'
-        elif metric == "Valuation":
-            napkin_text = f'${napkin_high["Valuation"]}M'
-        elif metric == "Cap Table":
-            napkin_text = f'{int(napkin_high["Cap Table"])}%'
-        else:
-            napkin_text = f'{int(napkin_high["Gross Margin"])}%'
-
-        ha_align = "left" if angular_offset > 0 else ("right" if angular_offset < 0 else "center")
-        ax.text(
-            adjusted_angle,
-            label_distance,
-            napkin_text,
-            ha=ha_align,
-            va="center",
-            fontsize=14,
-            fontweight="500",
+        # Linhas Low/High
+        ax.plot(
+            angles,
+            napkin_low_plot,
             color=COLORS["marine_blue"],
-            bbox=dict(
-                boxstyle="round,pad=0.3",
-                facecolor="white",
-                edgecolor=COLORS["marine_blue"],
-                linewidth=1.2,
-                alpha=0.85,
-            ),
-            zorder=5,
-        )
-
-    # Linha principal Purple
-    ax.plot(angles, purple_plot, color=COLORS["turquoise"], linewidth=4.5, linestyle="-", zorder=4)
-    ax.fill(angles, purple_plot, color=COLORS["turquoise"], alpha=0.25, zorder=3)
-
-    # Pontos em destaque
-    for i, (angle, value, metric) in enumerate(zip(angles[:-1], purple_normalized, order)):
-        ax.plot(angle, value, "o", color=COLORS["turquoise"], markersize=18, markeredgewidth=3.5, markeredgecolor="white", zorder=5)
-        ax.plot(angle, value, "o", color=COLORS["turquoise"], markersize=18, alpha=0.35, zorder=4.5)
-
-        if metric == "ARR":
-            label_text = f'${startup_metrics["ARR"]}M'
-        elif metric == "Growth":
-            label_text = f'{startup_metrics["Growth"]}%'
-        elif metric == "Round Size":
-            label_text = f'${startup_metrics["Round Size"]}M'
-        elif metric == "Valuation":
-            label_text = f'${startup_metrics["Valuation"]}M'
-        elif metric == "Cap Table":
-            label_text = f'{startup_metrics["Cap Table"]}%'
-        else:
-            label_text = f'{int(startup_metrics["Gross Margin"])}%'
-
-        ax.text(
-            angle,
-            value,
-            label_text,
-            ha="center",
-            va="center",
-            fontsize=15,
-            fontweight="bold",
-            color=COLORS["deep_ocean"],
-            bbox=dict(
-                boxstyle="round,pad=0.45",
-                facecolor="white",
-                edgecolor=COLORS["turquoise"],
-                linewidth=2.5,
-                alpha=0.98,
-            ),
-            zorder=6,
+            linewidth=1.8,
+            linestyle=":",
+            alpha=0.5,
+            zorder=2,
         )
-
-    # Eixos e labels externos
-    ax.set_xticks(angles[:-1])
-    ax.set_xticklabels([])
-    for angle, label in zip(angles[:-1], order):
-        rotation = np.rad2deg(angle)  # noqa: F841 (mantido para referência futura)
-        if label == "ARR":
-            ha, distance_mul = "center", 1.10
-        elif angle == 0:
-            ha, distance_mul = "center", 1.13
-        elif 0 < angle < np.pi:
-            ha, distance_mul = "left", 1.13
-        elif angle == np.pi:
-            ha, distance_mul = "center", 1.17
-        else:
-            ha, distance_mul = "right", 1.13
-        ax.text(
-            angle,
-            100 * distance_mul,
-            label,
-            ha=ha,
-            va="center",
-            fontsize=18,
-            fontweight="bold",
-            color=COLORS["deep_ocean"],
-            linespacing=1.3,
+        ax.plot(
+            angles,
+            napkin_high_plot,
+            color=COLORS["marine_blue"],
+            linewidth=1.8,
+            linestyle=":",
+            alpha=0.5,
+            zorder=2,
         )
 
-    # Remover borda circular
-    ax.spines["polar"].set_visible(False)
+    if draw_startup:
+        # Labels Low
+        for i, (angle, value, metric) in enumerate(zip(angles[:-1], napkin_low_normalized, order)):
+            purple_value = purple_normalized[i]
+            radial_offset, angular_offset, direction = _check_label_overlap(purple_value, value)
+            if radial_offset > 0:
+                label_distance = max(0, value - radial_offset) if direction == "down" else min(100, value + radial_offset)
+            else:
+                label_distance = value
+            adjusted_angle = angle + angular_offset
+
+            if metric == "ARR":
+                napkin_text = f'${napkin_low["ARR"]}M'
+            elif metric == "Growth":
+                napkin_text = f'{int(napkin_low["Growth"])}%'
+            elif metric == "Round Size":
+                napkin_text = f'${napkin_low["Round Size"]}M'
+            elif metric == "Valuation":
+                napkin_text = f'${napkin_low["Valuation"]}M'
+            elif metric == "Cap Table":
+                napkin_text = f'{int(napkin_low["Cap Table"])}%'
+            else:
+                napkin_text = f'{int(napkin_low["Gross Margin"])}%'
+
+            ha_align = "left" if angular_offset > 0 else ("right" if angular_offset < 0 else "center")
+            ax.text(
+                adjusted_angle,
+                label_distance,
+                napkin_text,
+                ha=ha_align,
+                va="center",
+                fontsize=14,
+                fontfamily=FONT_FAMILY,
+                fontweight="500",
+                color=COLORS["marine_blue"],
+                bbox=dict(
+                    boxstyle="round,pad=0.3",
+                    facecolor="white",
+                    edgecolor=COLORS["marine_blue"],
+                    linewidth=1.2,
+                    alpha=0.85,
+                ),
+                zorder=5,
+            )
+
+        # Labels High
+        for i, (angle, value, metric) in enumerate(zip(angles[:-1], napkin_high_normalized, order)):
+            purple_value = purple_normalized[i]
+            radial_offset, angular_offset, direction = _check_label_overlap(purple_value, value)
+            if radial_offset > 0:
+                label_distance = max(0, value - radial_offset) if direction == "down" else min(100, value + radial_offset)
+            else:
+                label_distance = value
+            adjusted_angle = angle + angular_offset
+
+            if metric == "ARR":
+                napkin_text = f'${napkin_high["ARR"]}M'
+            elif metric == "Growth":
+                napkin_text = f'{int(napkin_high["Growth"])}%'
+            elif metric == "Round Size":
+                napkin_text = f'${napkin_high["Round Size"]}M'
+            elif metric == "Valuation":
+                napkin_text = f'${napkin_high["Valuation"]}M'
+            elif metric == "Cap Table":
+                napkin_text = f'{int(napkin_high["Cap Table"])}%'
+            else:
+                napkin_text = f'{int(napkin_high["Gross Margin"])}%'
+
+            ha_align = "left" if angular_offset > 0 else ("right" if angular_offset < 0 else "center")
+            ax.text(
+                adjusted_angle,
+                label_distance,
+                napkin_text,
+                ha=ha_align,
+                va="center",
+                fontsize=14,
+                fontfamily=FONT_FAMILY,
+                fontweight="500",
+                color=COLORS["marine_blue"],
+                bbox=dict(
+                    boxstyle="round,pad=0.3",
+                    facecolor="white",
+                    edgecolor=COLORS["marine_blue"],
+                    linewidth=1.2,
+                    alpha=0.85,
+                ),
+                zorder=5,
+            )
+
+        # Envelope de incerteza (percentis do Monte Carlo, ver `napkin_uncertainty`)
+        if envelope is not None:
+            envelope_low, envelope_high = ([min(100, v) for v in e] + [min(100, e[0])] for e in envelope)
+            ax.fill_between(
+                angles, envelope_low, envelope_high, color=COLORS["turquoise"], alpha=0.18, zorder=3.5
+            )
+            for envelope_line in (envelope_low, envelope_high):
+                ax.plot(
+                    angles,
+                    envelope_line,
+                    color=COLORS["turquoise"],
+                    linewidth=1.5,
+                    linestyle="--",
+                    alpha=0.6,
+                    zorder=3.5,
+                )
+
+        # Linha principal Purple
+        ax.plot(angles, purple_plot, color=COLORS["turquoise"], linewidth=4.5, linestyle="-", zorder=4)
+        ax.fill(angles, purple_plot, color=COLORS["turquoise"], alpha=0.25, zorder=3)
+
+        # Pontos em destaque
+        for i, (angle, value, metric) in enumerate(zip(angles[:-1], purple_normalized, order)):
+            ax.plot(angle, value, "o", color=COLORS["turquoise"], markersize=18, markeredgewidth=3.5, markeredgecolor="white", zorder=5)
+            ax.plot(angle, value, "o", color=COLORS["turquoise"], markersize=18, alpha=0.35, zorder=4.5)
+
+            if metric == "ARR":
+                label_text = f'${startup_metrics["ARR"]}M'
+            elif metric == "Growth":
+                label_text = f'{startup_metrics["Growth"]}%'
+            elif metric == "Round Size":
+                label_text = f'${startup_metrics["Round Size"]}M'
+            elif metric == "Valuation":
+                label_text = f'${startup_metrics["Valuation"]}M'
+            elif metric == "Cap Table":
+                label_text = f'{startup_metrics["Cap Table"]}%'
+            else:
+                label_text = f'{int(startup_metrics["Gross Margin"])}%'
+
+            ax.text(
+                angle,
+                value,
+                label_text,
+                ha="center",
+                va="center",
+                fontsize=15,
+                fontfamily=FONT_FAMILY,
+                fontweight="bold",
+                color=COLORS["deep_ocean"],
+                bbox=dict(
+                    boxstyle="round,pad=0.45",
+                    facecolor="white",
+                    edgecolor=COLORS["turquoise"],
+                    linewidth=2.5,
+                    alpha=0.98,
+                ),
+                zorder=6,
+            )
+
+    if draw_background:
+        # Eixos e labels externos
+        ax.set_xticks(angles[:-1])
+        ax.set_xticklabels([])
+        for angle, label in zip(angles[:-1], order):
+            rotation = np.rad2deg(angle)  # noqa: F841 (mantido para referência futura)
+            if label == "ARR":
+                ha, distance_mul = "center", 1.10
+            elif angle == 0:
+                ha, distance_mul = "center", 1.13
+            elif 0 < angle < np.pi:
+                ha, distance_mul = "left", 1.13
+            elif angle == np.pi:
+                ha, distance_mul = "center", 1.17
+            else:
+                ha, distance_mul = "right", 1.13
+            ax.text(
+                angle,
+                100 * distance_mul,
+                label,
+                ha=ha,
+                va="center",
+                fontsize=18,
+                fontfamily=FONT_FAMILY,
+                fontweight="bold",
+                color=COLORS["deep_ocean"],
+                linespacing=1.3,
+            )
+
+        # Remover borda circular
+        ax.spines["polar"].set_visible(False)
 
     # Legenda
     legend_y = 0.09
     legend_x_start = 0.18
 
-    # Série principal (Startup)
-    fig.patches.append(
-        plt.Rectangle(
-            (legend_x_start, legend_y),
-            0.025,
-            0.012,
+    if draw_background:
+        # Série principal (Startup)
+        fig.patches.append(
+            Rectangle(
+                (legend_x_start, legend_y),
+                0.025,
+                0.012,
+                transform=fig.transFigure,
+                facecolor=COLORS["turquoise"],
+                edgecolor="white",
+                linewidth=2.5,
+            )
+        )
+    if draw_startup:
+        fig.text(
+            legend_x_start + 0.035,
+            legend_y + 0.006,
+            f"{startup_name} Metrics",
             transform=fig.transFigure,
-            facecolor=COLORS["turquoise"],
-            edgecolor="white",
-            linewidth=2.5,
+            fontsize=16,
+            fontfamily=FONT_FAMILY,
+            fontweight="700",
+            color=COLORS["deep_ocean"],
+            va="center",
         )
-    )
-    fig.text(
-        legend_x_start + 0.035,
-        legend_y + 0.006,
-        f"{startup_name} Metrics",
-        transform=fig.transFigure,
-        fontsize=16,
-        fontweight="700",
-        color=COLORS["deep_ocean"],
-        va="center",
-    )
 
-    # Napkin Low
-    napkin_low_x = legend_x_start + 0.20
-    fig.patches.append(
-        plt.Rectangle(
-            (napkin_low_x, legend_y),
-            0.025,
-            0.012,
+    if draw_background:
+        # Napkin Low
+        napkin_low_x = legend_x_start + 0.20
+        fig.patches.append(
+            Rectangle(
+                (napkin_low_x, legend_y),
+                0.025,
+                0.012,
+                transform=fig.transFigure,
+                facecolor=COLORS["marine_blue"],
+                edgecolor="white",
+                linewidth=1.2,
+                alpha=0.35,
+            )
+        )
+        fig.text(
+            napkin_low_x + 0.035,
+            legend_y + 0.006,
+            "Napkin Low",
             transform=fig.transFigure,
-            facecolor=COLORS["marine_blue"],
-            edgecolor="white",
-            linewidth=1.2,
-            alpha=0.35,
+            fontsize=16,
+            fontfamily=FONT_FAMILY,
+            fontweight="700",
+            color=COLORS["deep_ocean"],
+            va="center",
         )
-    )
-    fig.text(
-        napkin_low_x + 0.035,
-        legend_y + 0.006,
-        "Napkin Low",
-        transform=fig.transFigure,
-        fontsize=16,
-        fontweight="700",
-        color=COLORS["deep_ocean"],
-        va="center",
-    )
 
-    # Napkin High
-    napkin_high_x = legend_x_start + 0.35
-    fig.patches.append(
-        plt.Rectangle(
-            (napkin_high_x, legend_y),
-            0.025,
-            0.012,
+        # Napkin High
+        napkin_high_x = legend_x_start + 0.35
+        fig.patches.append(
+            Rectangle(
+                (napkin_high_x, legend_y),
+                0.025,
+                0.012,
+                transform=fig.transFigure,
+                facecolor=COLORS["marine_blue"],
+                edgecolor="white",
+                linewidth=1.2,
+                alpha=0.35,
+            )
+        )
+        fig.text(
+            napkin_high_x + 0.035,
+            legend_y + 0.006,
+            "Napkin High",
             transform=fig.transFigure,
-            facecolor=COLORS["marine_blue"],
-            edgecolor="white",
-            linewidth=1.2,
-            alpha=0.35,
+            fontsize=16,
+            fontfamily=FONT_FAMILY,
+            fontweight="700",
+            color=COLORS["deep_ocean"],
+            va="center",
         )
-    )
-    fig.text(
-        napkin_high_x + 0.035,
-        legend_y + 0.006,
-        "Napkin High",
-        transform=fig.transFigure,
-        fontsize=16,
-        fontweight="700",
-        color=COLORS["deep_ocean"],
-        va="center",
-    )
 
-    # Nota de rodapé
-    fig.text(
-        0.5,
-        0.04,
-        "Napkin Benchmark: ARR $0.64M-$1.83M | Growth 200% | Round $1.46M-$3.66M | Valuation $5.86M-$10.9M | Cap Table 80% | Gross Margin 70%",
-        ha="center",
-        va="center",
-        fontsize=13.5,
-        color=COLORS["marine_blue"],
-        style="italic",
-        transform=fig.transFigure,
-    )
+        # Nota de rodapé
+        fig.text(
+            0.5,
+            0.04,
+            footnote_text(napkin_low, napkin_high, version=benchmark_version),
+            ha="center",
+            va="center",
+            fontsize=13.5,
+            fontfamily=FONT_FAMILY,
+            color=COLORS["marine_blue"],
+            style="italic",
+            transform=fig.transFigure,
+        )
 
     # Margens
-    plt.subplots_adjust(left=0.1, right=0.9, top=0.93, bottom=0.20)
+    fig.subplots_adjust(left=0.1, right=0.9, top=0.93, bottom=0.20)
     return fig
 
 
+# Renderização concorrente: limite de PNGs rasterizados em paralelo
+RENDER_WORKERS = int(os.environ.get("NAPKIN_RENDER_WORKERS", min(4, os.cpu_count() or 1)))
+_render_executor: ThreadPoolExecutor | None = None
+_render_executor_lock = threading.Lock()
+
+
+def render_executor() -> ThreadPoolExecutor:
+    """Executor compartilhado (criado sob demanda) que limita renderizações simultâneas."""
+    global _render_executor
+    with _render_executor_lock:
+        if _render_executor is None:
+            _render_executor = ThreadPoolExecutor(max_workers=RENDER_WORKERS, thread_name_prefix="napkin-render")
+        return _render_executor
+
+
+def figure_to_png(fig: Figure, *, dpi: int = 300) -> bytes:
+    """Rasteriza a Figure em PNG (mesmos parâmetros do download do app)."""
+    buffer = io.BytesIO()
+    fig.savefig(
+        buffer,
+        format="png",
+        dpi=dpi,
+        bbox_inches="tight",
+        facecolor="white",
+        edgecolor="none",
+        pad_inches=0.3,
+    )
+    return buffer.getvalue()
+
 
+def render_png(
+    startup_metrics: dict,
+    napkin_low: dict,
+    napkin_high: dict,
+    *,
+    dpi: int = 300,
+    **kwargs,
+) -> bytes:
+    """Monta a figura com `build_figure` e retorna os bytes do PNG."""
+    fig = build_figure(startup_metrics, napkin_low, napkin_high, **kwargs)
+    return figure_to_png(fig, dpi=dpi)
+
+
+def submit_render(
+    startup_metrics: dict,
+    napkin_low: dict,
+    napkin_high: dict,
+    **kwargs,
+) -> Future:
+    """Agenda `render_png` no executor limitado; retorna o Future com os bytes do PNG."""
+    return render_executor().submit(render_png, startup_metrics, napkin_low, napkin_high, **kwargs)
@@ -0,0 +1,107 @@
+import io
+from functools import lru_cache
+
+import numpy as np
+from matplotlib.transforms import Bbox
+from PIL import Image
+
+from napkin_plot import DEFAULT_METRIC_ORDER, build_figure
+
+
+# Mesmo respiro do download do app (savefig com pad_inches=0.3)
+PAD_INCHES = 0.3
+
+
+def _rasterize(fig, dpi: int) -> Image.Image:
+    """Desenha a Figure no canvas Agg e devolve uma imagem RGBA do Pillow."""
+    fig.set_dpi(dpi)
+    fig.canvas.draw()
+    return Image.fromarray(np.asarray(fig.canvas.buffer_rgba()).copy())
+
+
+def _benchmark_key(napkin_low: dict, napkin_high: dict, order: tuple) -> tuple:
+    return tuple(napkin_low[m] for m in order), tuple(napkin_high[m] for m in order)
+
+
+@lru_cache(maxsize=64)
+def _background_layer(bench_key: tuple, order: tuple, dpi: int, version: str | None) -> tuple[Image.Image, Bbox]:
+    """
+    Renderiza (uma vez por estágio, versão e tamanho) a camada de fundo.
+    Retorna a imagem e o bbox "tight" (em polegadas) dos artistas do fundo.
+    """
+    low_values, high_values = bench_key
+    napkin_low = dict(zip(order, low_values))
+    napkin_high = dict(zip(order, high_values))
+    # A camada de fundo não usa as métricas da startup; a própria faixa serve de placeholder
+    fig = build_figure(
+        napkin_low,
+        napkin_low,
+        napkin_high,
+        metric_order=list(order),
+        layer="background",
+        benchmark_version=version,
+    )
+    image = _rasterize(fig, dpi)
+    return image, fig.get_tightbbox(fig.canvas.get_renderer())
+
+
+def _frame(image: Image.Image, bbox: Bbox, fig_height: float, dpi: int) -> Image.Image:
+    """
+    Enquadra a imagem da figura como `savefig(bbox_inches="tight", pad_inches=PAD_INCHES)`:
+    canvas do tamanho do bbox com margem (estendido em branco além da figura, se preciso).
+    """
+    bbox = bbox.padded(PAD_INCHES)
+    framed = Image.new("RGB", (int(bbox.width * dpi), int(bbox.height * dpi)), "white")
+    framed.paste(image, (round(-bbox.x0 * dpi), round((bbox.y1 - fig_height) * dpi)))
+    return framed
+
+
+def composite_image(
+    startup_metrics: dict,
+    napkin_low: dict,
+    napkin_high: dict,
+    *,
+    metric_order: list | None = None,
+    startup_name: str = "Startup",
+    dpi: int = 150,
+    benchmark_version: str | None = None,
+    envelope: tuple | None = None,
+) -> Image.Image:
+    """
+    Compõe o gráfico radar sobre o fundo pré-renderizado do estágio.
+    Só a camada da startup (polígono, pontos e labels) é desenhada a cada chamada.
+    """
+    order = tuple(metric_order or DEFAULT_METRIC_ORDER)
+    background, background_bbox = _background_layer(
+        _benchmark_key(napkin_low, napkin_high, order), order, dpi, benchmark_version
+    )
+    fig = build_figure(
+        startup_metrics,
+        napkin_low,
+        napkin_high,
+        metric_order=list(order),
+        startup_name=startup_name,
+        layer="startup",
+        envelope=envelope,
+    )
+    image = Image.alpha_composite(background, _rasterize(fig, dpi))
+    # Mesmo enquadramento do gráfico completo: bbox da união das duas camadas
+    bbox = Bbox.union([background_bbox, fig.get_tightbbox(fig.canvas.get_renderer())])
+    return _frame(image, bbox, fig.get_figheight(), dpi)
+
+
+def composite_png(
+    startup_metrics: dict,
+    napkin_low: dict,
+    napkin_high: dict,
+    **kwargs,
+) -> bytes:
+    """Mesmo que `composite_image`, retornando os bytes do PNG."""
+    buffer = io.BytesIO()
+    composite_image(startup_metrics, napkin_low, napkin_high, **kwargs).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def clear_background_cache() -> None:
+    """Descarta as camadas de fundo em cache (ex.: após trocar de versão de benchmark)."""
+    _background_layer.cache_clear()
@@ -0,0 +1,187 @@
+import json
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from napkin_history import NAPKIN_HISTORY, normalize_rounds, resolve_stage_bands
+from napkin_plot import DEFAULT_METRIC_ORDER, stage_distances
+
+
+# Colunas do CSV de portfólio (além das métricas); Stage e Round Date são opcionais
+COMPANY_COLUMN = "Startup"
+STAGE_COLUMN = "Stage"
+DATE_COLUMN = "Round Date"
+
+# Store de resultados: <base>.npy (array estruturado, carregado via memmap) + <base>.json (schema)
+SCHEMA_VERSION = 1
+
+
+def _paths(path) -> tuple[Path, Path]:
+    base = Path(path)
+    return base.with_suffix(".npy"), base.with_suffix(".json")
+
+
+def read_portfolio(source, *, metric_order: list | None = None, history: dict | None = None) -> list[dict]:
+    """
+    Lê o CSV do portfólio (caminho ou arquivo aberto) em linhas
+    {'company', 'stage', 'date', 'metrics'}; 'stage' e 'date' ficam None quando ausentes.
+    Estágios sem histórico de benchmark e métricas vazias são rejeitados de uma vez, antes de
+    qualquer renderização.
+    """
+    order = metric_order or DEFAULT_METRIC_ORDER
+    history = NAPKIN_HISTORY if history is None else history
+    df = pd.read_csv(source)
+    missing = [c for c in [COMPANY_COLUMN, *order] if c not in df.columns]
+    if missing:
+        raise ValueError(f"Colunas ausentes no CSV: {', '.join(missing)}")
+
+    rows = []
+    invalid = []
+    for line, record in enumerate(df.to_dict("records"), start=2):  # linha 1 é o cabeçalho
+        stage = record.get(STAGE_COLUMN)
+        round_date = record.get(DATE_COLUMN)
+        stage = None if pd.isna(stage) else str(stage)
+        if stage is not None and stage not in history:
+            invalid.append(f"linha {line} ({record[COMPANY_COLUMN]}): estágio desconhecido {stage!r}")
+        metrics = {m: float(pd.to_numeric(record[m], errors="coerce")) for m in order}
+        empty = [m for m, v in metrics.items() if np.isnan(v)]
+        if empty:
+            invalid.append(f"linha {line} ({record[COMPANY_COLUMN]}): métrica vazia ou inválida {', '.join(empty)}")
+        rows.append(
+            {
+                "company": str(record[COMPANY_COLUMN]),
+                "stage": stage,
+                "date": None if pd.isna(round_date) else pd.Timestamp(round_date).date(),
+                "metrics": metrics,
+            }
+        )
+    if invalid:
+        raise ValueError("Linhas inválidas no CSV: " + "; ".join(invalid))
+    return rows
+
+
+def results_dtype(
+    metric_order: list | None = None,
+    *,
+    name_length: int = 64,
+    stage_length: int = 16,
+    version_length: int = 16,
+) -> np.dtype:
+    """Dtype estruturado de uma linha de resultado (empresa, estágio, versão, brutos, normalizados)."""
+    order = metric_order or DEFAULT_METRIC_ORDER
+    return np.dtype(
+        [
+            ("company", f"U{name_length}"),
+            ("stage", f"U{stage_length}"),
+            ("version", f"U{version_length}"),
+            ("raw", "f8", (len(order),)),
+            ("normalized", "f8", (len(order),)),
+        ]
+    )
+
+
+def score_portfolio(
+    companies,
+    values,
+    stages=None,
+    dates=None,
+    *,
+    metric_order: list | None = None,
+    history: dict | None = None,
+) -> np.ndarray:
+    """
+    Pontua um portfólio inteiro (values[N, M]) e devolve o array estruturado de resultados.
+
+    Sem `dates`, usa os benchmarks vigentes hoje. Sem `stages`, usa o estágio mais aderente
+    de cada linha contra as versões vigentes na sua data (mesma distância de `score_stages`).
+    Cada linha é normalizada contra a versão do benchmark vigente na sua data
+    (`napkin_history.normalize_rounds`).
+    """
+    order = metric_order or DEFAULT_METRIC_ORDER
+    history = NAPKIN_HISTORY if history is None else history
+    values = np.atleast_2d(np.asarray(values, dtype=float))
+    companies = np.asarray(companies, dtype=str)
+    if dates is None:
+        dates = date.today()
+    if stages is None:
+        # Faixas (N, S, M): para cada estágio, a versão vigente na data de cada linha
+        row_dates = np.broadcast_to(np.asarray(dates, dtype="datetime64[D]"), (len(values),))
+        stage_names, _, low, high = resolve_stage_bands(row_dates, history, metric_order=order)
+        stages = np.asarray(stage_names)[np.argmin(stage_distances(values, low, high), axis=1)]
+    stages = np.broadcast_to(np.asarray(stages, dtype=str), (len(values),))
+    normalized, versions = normalize_rounds(values, stages, dates, history, metric_order=order)
+
+    # Larguras das colunas de texto medidas nos dados (nunca truncar estágio/versão)
+    dtype = results_dtype(
+        order,
+        name_length=max(1, max((len(c) for c in companies), default=1)),
+        stage_length=max(1, max((len(s) for s in stages.tolist()), default=1)),
+        version_length=max(1, max((len(v) for v in versions.tolist()), default=1)),
+    )
+    results = np.empty(len(values), dtype=dtype)
+    results["company"] = companies
+    results["stage"] = stages
+    results["version"] = versions
+    results["raw"] = values
+    results["normalized"] = normalized
+    return results
+
+
+def save_results(path, results: np.ndarray, *, metric_order: list | None = None) -> dict:
+    """
+    Grava os resultados ordenados por (estágio, empresa) em <path>.npy e o schema em <path>.json.
+    O schema guarda o intervalo de linhas de cada estágio, para fatiar sem varrer o arquivo.
+    """
+    order = metric_order or DEFAULT_METRIC_ORDER
+    npy_path, schema_path = _paths(path)
+    results = results[np.argsort(results, order=("stage", "company"), kind="stable")]
+
+    stored = np.lib.format.open_memmap(npy_path, mode="w+", dtype=results.dtype, shape=results.shape)
+    stored[...] = results
+    stored.flush()
+    del stored
+
+    stage_names, starts = np.unique(results["stage"], return_index=True)
+    stops = list(starts[1:]) + [len(results)]
+    schema = {
+        "schema_version": SCHEMA_VERSION,
+        "rows": int(len(results)),
+        "metrics": list(order),
+        "dtype": np.lib.format.dtype_to_descr(results.dtype),
+        "stages": {str(s): [int(a), int(b)] for s, a, b in zip(stage_names, starts, stops)},
+        "versions": sorted(set(results["version"].tolist())),
+    }
+    schema_path.write_text(json.dumps(schema, indent=2, ensure_ascii=False))
+    return schema
+
+
+def load_results(path, *, mmap: bool = True) -> tuple[np.ndarray, dict]:
+    """Abre o store (memmap somente leitura por padrão) e retorna (resultados, schema)."""
+    npy_path, schema_path = _paths(path)
+    schema = json.loads(schema_path.read_text())
+    if schema.get("schema_version") != SCHEMA_VERSION:
+        raise ValueError(f"Versão de schema não suportada: {schema.get('schema_version')}")
+    results = np.load(npy_path, mmap_mode="r" if mmap else None)
+    if len(results) != schema["rows"]:
+        raise ValueError(f"{npy_path} tem {len(results)} linhas, schema indica {schema['rows']}")
+    return results, schema
+
+
+def select(results: np.ndarray, schema: dict, *, stage: str | None = None, companies=None) -> np.ndarray:
+    """
+    Fatia os resultados por estágio (visão contígua, sem cópia) e/ou por empresas.
+    """
+    if stage is not None:
+        start, stop = schema["stages"].get(stage, (0, 0))
+        results = results[start:stop]
+    if companies is not None:
+        results = results[np.isin(results["company"], np.asarray(companies, dtype=str))]
+    return results
+
+
+def row_metrics(row, metric_order: list | None = None) -> dict:
+    """Converte uma linha do store no dicionário de métricas esperado por `build_figure`."""
+    order = metric_order or DEFAULT_METRIC_ORDER
+    return {metric: float(v) for metric, v in zip(order, row["raw"])}
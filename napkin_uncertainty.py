@@ -0,0 +1,87 @@
+import time
+
+import numpy as np
+
+from napkin_plot import DEFAULT_METRIC_ORDER, normalize_array
+
+
+DEFAULT_SAMPLES = 100_000
+DEFAULT_SEED = 42
+DEFAULT_PERCENTILES = (5, 95)
+
+
+def sample_metrics(
+    ranges: dict,
+    *,
+    n: int = DEFAULT_SAMPLES,
+    seed: int = DEFAULT_SEED,
+    metric_order: list | None = None,
+) -> np.ndarray:
+    """
+    Sorteia `n` cenários (n, M) a partir das faixas informadas por métrica:
+    - número: valor fixo;
+    - (mín, máx): distribuição uniforme;
+    - (mín, moda, máx): distribuição triangular.
+    """
+    order = metric_order or DEFAULT_METRIC_ORDER
+    rng = np.random.default_rng(seed)
+    samples = np.empty((n, len(order)), dtype=float)
+    for j, metric in enumerate(order):
+        spec = ranges[metric]
+        if np.isscalar(spec):
+            samples[:, j] = float(spec)
+        elif len(spec) == 2:
+            low, high = sorted(float(v) for v in spec)
+            samples[:, j] = rng.uniform(low, high, n) if high > low else low
+        elif len(spec) == 3:
+            low, mode, high = (float(v) for v in spec)
+            if not low <= mode <= high:
+                raise ValueError(f"{metric}: esperado mín <= moda <= máx, recebido {spec}")
+            samples[:, j] = rng.triangular(low, mode, high, n) if high > low else low
+        else:
+            raise ValueError(f"{metric}: faixa deve ser um número, (mín, máx) ou (mín, moda, máx)")
+    return samples
+
+
+def simulate(
+    ranges: dict,
+    napkin_low: dict,
+    napkin_high: dict,
+    *,
+    n: int = DEFAULT_SAMPLES,
+    seed: int = DEFAULT_SEED,
+    percentiles: tuple = DEFAULT_PERCENTILES,
+    metric_order: list | None = None,
+    normalize=None,
+) -> dict:
+    """
+    Monte Carlo das métricas da startup contra a faixa Napkin do estágio.
+
+    Os `n` cenários são normalizados num único lote vetorizado: por padrão com o mesmo
+    mapeamento da faixa usado em `build_figure`; `normalize(samples[n, M])` permite usar a
+    escala do gráfico exibido (ex.: a escala por métrica do app). Retorna:
+    - 'envelope': (percentil inferior, percentil superior) normalizados, para o envelope do gráfico;
+    - 'median': mediana normalizada por métrica; 'metrics': mediana dos valores brutos;
+    - 'samples', 'seed', 'percentiles' e 'seconds' (tempo de sorteio + normalização).
+    """
+    order = metric_order or DEFAULT_METRIC_ORDER
+    start = time.perf_counter()
+    samples = sample_metrics(ranges, n=n, seed=seed, metric_order=order)
+    if normalize is None:
+        low = np.array([napkin_low[m] for m in order], dtype=float)
+        high = np.array([napkin_high[m] for m in order], dtype=float)
+        normalized = normalize_array(samples, low, high)
+    else:
+        normalized = normalize(samples)
+    lower, median, upper = np.percentile(normalized, [percentiles[0], 50, percentiles[1]], axis=0)
+    raw_median = np.median(samples, axis=0)
+    elapsed = time.perf_counter() - start
+    return {
+        "envelope": (lower.tolist(), upper.tolist()),
+        "median": median.tolist(),
+        "metrics": dict(zip(order, raw_median.tolist())),
+        "samples": n,
+        "seed": seed,
+        "percentiles": tuple(percentiles),
+        "seconds": elapsed,
+    }
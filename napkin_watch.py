@@ -0,0 +1,183 @@
+"""
+Rebuild incremental dos gráficos do portfólio: só re-renderiza as linhas cuja impressão
+digital (métricas + estágio + versão/valores do benchmark + configurações de renderização)
+mudou, remove PNGs de empresas que saíram do CSV e, em modo watch, repete a cada alteração.
+
+Uso:
+    python napkin_watch.py portfolio.csv charts/ [--watch] [--dpi 150]
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from datetime import date
+from pathlib import Path
+
+from napkin_history import benchmark_at, benchmarks_at
+from napkin_plot import DEFAULT_METRIC_ORDER, best_fit_stage, render_executor
+from napkin_raster import composite_png
+from napkin_store import read_portfolio
+
+
+# Incrementar quando o desenho do gráfico mudar, para invalidar todos os PNGs existentes
+RENDERER_VERSION = 1
+MANIFEST_NAME = ".napkin_manifest.json"
+
+
+def output_name(company: str) -> str:
+    """Nome do PNG de uma empresa (slug estável)."""
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", company).strip("_").lower() or "startup"
+    return f"{slug}.png"
+
+
+def resolve_benchmark(row: dict, history: dict | None = None, *, default_date: date | None = None) -> tuple[str, dict]:
+    """
+    Estágio e versão de benchmark de uma linha do portfólio (`napkin_store.read_portfolio`).
+    Sem estágio, usa o mais aderente; sem data, os benchmarks vigentes em `default_date` (hoje).
+    """
+    when = row["date"] or default_date or date.today()
+    stage = row["stage"]
+    if stage is None:
+        stage, _ = best_fit_stage(row["metrics"], benchmarks_at(when, history))
+    return stage, benchmark_at(stage, when, history)
+
+
+def fingerprint(row: dict, stage: str, bench: dict, settings: dict) -> str:
+    """Impressão digital do que determina o PNG de uma linha."""
+    payload = {
+        "company": row["company"],
+        "metrics": row["metrics"],
+        "stage": stage,
+        "version": bench["version"],
+        "low": bench["low"],
+        "high": bench["high"],
+        "settings": settings,
+        "renderer": RENDERER_VERSION,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _load_manifest(out_dir: Path) -> dict:
+    path = out_dir / MANIFEST_NAME
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def rebuild(
+    rows: list,
+    out_dir,
+    *,
+    dpi: int = 150,
+    metric_order: list | None = None,
+    history: dict | None = None,
+) -> dict:
+    """
+    Renderiza apenas as linhas novas ou alteradas e remove saídas órfãs.
+    Retorna {'rendered', 'skipped', 'deleted', 'seconds'}.
+    """
+    start = time.perf_counter()
+    order = metric_order or DEFAULT_METRIC_ORDER
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    settings = {"dpi": dpi, "metric_order": list(order)}
+    previous = _load_manifest(out_dir)
+
+    current: dict[str, str] = {}
+    pending = []
+    for row in rows:
+        name = output_name(row["company"])
+        if name in current:
+            raise ValueError(f"Duas empresas geram o mesmo arquivo {name}: renomeie uma delas no CSV")
+        stage, bench = resolve_benchmark(row, history)
+        current[name] = fingerprint(row, stage, bench, settings)
+        if previous.get(name) != current[name] or not (out_dir / name).exists():
+            pending.append((name, row, bench))
+
+    futures = [
+        (
+            name,
+            render_executor().submit(
+                composite_png,
+                row["metrics"],
+                bench["low"],
+                bench["high"],
+                metric_order=list(order),
+                startup_name=row["company"],
+                dpi=dpi,
+                benchmark_version=bench["version"],
+            ),
+        )
+        for name, row, bench in pending
+    ]
+    for name, future in futures:
+        _write_atomic(out_dir / name, future.result())
+
+    orphans = [name for name in previous if name not in current]
+    for name in orphans:
+        (out_dir / name).unlink(missing_ok=True)
+
+    _write_atomic(out_dir / MANIFEST_NAME, json.dumps(current, indent=2, sort_keys=True).encode())
+    return {
+        "rendered": len(pending),
+        "skipped": len(rows) - len(pending),
+        "deleted": len(orphans),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def _summary(stats: dict) -> str:
+    return (
+        f"{stats['rendered']} renderizados, {stats['skipped']} pulados, "
+        f"{stats['deleted']} removidos em {stats['seconds']:.1f}s"
+    )
+
+
+def watch(csv_path, out_dir, *, interval: float = 2.0, **kwargs) -> None:
+    """
+    Observa o CSV (por mtime) e roda `rebuild` a cada alteração, até Ctrl+C.
+    Um CSV inválido (ou salvo pela metade) só gera um aviso: o manifesto anterior é mantido
+    e o rebuild é tentado de novo na próxima alteração.
+    """
+    csv_path = Path(csv_path)
+    last_mtime = None
+    try:
+        while True:
+            mtime = csv_path.stat().st_mtime_ns if csv_path.exists() else None
+            if mtime is not None and mtime != last_mtime:
+                last_mtime = mtime
+                try:
+                    rows = read_portfolio(
+                        csv_path, metric_order=kwargs.get("metric_order"), history=kwargs.get("history")
+                    )
+                    print(_summary(rebuild(rows, out_dir, **kwargs)))
+                except Exception as exc:  # noqa: BLE001 (o watch continua até o próximo salvamento)
+                    print(f"Erro ao reconstruir {csv_path}: {exc}")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild incremental dos gráficos Napkin do portfólio")
+    parser.add_argument("csv", help="CSV do portfólio (Startup, métricas e, opcionalmente, Stage e Round Date)")
+    parser.add_argument("out_dir", help="diretório de saída dos PNGs")
+    parser.add_argument("--dpi", type=int, default=150)
+    parser.add_argument("--watch", action="store_true", help="continua observando o CSV")
+    parser.add_argument("--interval", type=float, default=2.0, help="intervalo de verificação no modo watch (s)")
+    args = parser.parse_args()
+
+    if args.watch:
+        watch(args.csv, args.out_dir, interval=args.interval, dpi=args.dpi)
+    else:
+        print(_summary(rebuild(read_portfolio(args.csv), args.out_dir, dpi=args.dpi)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from napkin_history import NAPKIN_HISTORY, add_version, benchmark_at, resolve_benchmarks
+
+
+@pytest.fixture
+def history():
+    history = {stage: list(versions) for stage, versions in NAPKIN_HISTORY.items()}
+    seed = NAPKIN_HISTORY["Seed"][0]
+    add_version("Seed", date(2025, 7, 1), "v2", seed["low"], {**seed["high"], "ARR": 2.5}, history)
+    return history
+
+
+def test_benchmark_at_picks_version_valid_on_date(history):
+    assert benchmark_at("Seed", date(2025, 6, 30), history)["version"] == "v1"
+    assert benchmark_at("Seed", date(2025, 7, 1), history)["version"] == "v2"
+
+
+def test_benchmark_at_accepts_datetime(history):
+    assert benchmark_at("Seed", datetime(2025, 7, 1, 15, 30), history)["version"] == "v2"
+
+
+def test_resolve_benchmarks_per_row(history):
+    versions, _, high = resolve_benchmarks(
+        ["Seed", "Seed", "Series A"], ["2025-06-30", "2025-07-01", "2025-07-01"], history
+    )
+    assert versions.tolist() == ["v1", "v2", "v1"]
+    assert high[:, 0].tolist() == [1.83, 2.5, 5.49]
+
+
+def test_resolve_benchmarks_scalar_stage_broadcasts_over_dates(history):
+    versions, _, _ = resolve_benchmarks("Seed", np.array(["2025-01-01", "2026-01-01"]), history)
+    assert versions.tolist() == ["v1", "v2"]
+
+
+def test_resolve_benchmarks_reports_unknown_stage(history):
+    with pytest.raises(KeyError, match="Series C"):
+        resolve_benchmarks(["Seed", "Series C"], "2025-01-01", history)
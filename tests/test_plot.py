@@ -0,0 +1,28 @@
+import pytest
+
+from napkin_plot import NAPKIN_BENCHMARKS, _normalize_value, best_fit_stage, normalize_array
+
+
+@pytest.mark.parametrize("stage", list(NAPKIN_BENCHMARKS))
+def test_normalize_array_matches_scalar_normalization(stage):
+    low, high = NAPKIN_BENCHMARKS[stage]["low"], NAPKIN_BENCHMARKS[stage]["high"]
+    for metric in low:
+        lo, hi = low[metric], high[metric]
+        values = [0.0, lo, (lo + hi) / 2, hi, 2 * hi + 1, 50 * hi + 1]
+        expected = [_normalize_value(v, hi, low=lo, high=hi) for v in values]
+        assert normalize_array(values, lo, hi).tolist() == pytest.approx(expected), metric
+
+
+def test_best_fit_stage_for_app_default_inputs():
+    default_inputs = {
+        "ARR": 1.1,
+        "Growth": 389.0,
+        "Round Size": 3.5,
+        "Valuation": 13.0,
+        "Cap Table": 72.0,
+        "Gross Margin": 82.0,
+    }
+    best, scores = best_fit_stage(default_inputs)
+    assert best == "Seed"
+    assert set(scores) == set(NAPKIN_BENCHMARKS)
+    assert sum(s["confidence"] for s in scores.values()) == pytest.approx(1.0)
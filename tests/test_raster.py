@@ -0,0 +1,37 @@
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from napkin_plot import NAPKIN_BENCHMARKS, render_png
+from napkin_raster import composite_png
+
+
+STARTUP_METRICS = {
+    "ARR": 1.1,
+    "Growth": 389.0,
+    "Round Size": 3.5,
+    "Valuation": 13.0,
+    "Cap Table": 72.0,
+    "Gross Margin": 82.0,
+}
+
+
+@pytest.mark.parametrize("stage", list(NAPKIN_BENCHMARKS))
+def test_composite_has_same_framing_as_full_render(stage):
+    bench = NAPKIN_BENCHMARKS[stage]
+    composite = Image.open(io.BytesIO(composite_png(STARTUP_METRICS, bench["low"], bench["high"], dpi=40)))
+    full = Image.open(io.BytesIO(render_png(STARTUP_METRICS, bench["low"], bench["high"], dpi=40)))
+    assert composite.size == full.size
+
+
+@pytest.mark.parametrize("stage", list(NAPKIN_BENCHMARKS))
+def test_composite_matches_full_render_pixels(stage):
+    # Só o antialiasing nas bordas das camadas difere (~0,6 de erro médio a 150 dpi);
+    # uma camada ausente ou deslocada fica acima de 3
+    bench = NAPKIN_BENCHMARKS[stage]
+    composite = Image.open(io.BytesIO(composite_png(STARTUP_METRICS, bench["low"], bench["high"], dpi=150)))
+    full = Image.open(io.BytesIO(render_png(STARTUP_METRICS, bench["low"], bench["high"], dpi=150)))
+    diff = np.abs(np.asarray(composite.convert("RGB"), dtype=float) - np.asarray(full.convert("RGB"), dtype=float))
+    assert diff.mean() < 1.5
@@ -0,0 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from napkin_plot import NAPKIN_BENCHMARKS, render_png, submit_render
+
+
+STARTUP_METRICS = {
+    "ARR": 1.1,
+    "Growth": 389.0,
+    "Round Size": 3.5,
+    "Valuation": 13.0,
+    "Cap Table": 72.0,
+    "Gross Margin": 82.0,
+}
+DPI = 30
+RENDERS = 16
+
+
+@pytest.fixture(scope="module")
+def seed_bench():
+    return NAPKIN_BENCHMARKS["Seed"]
+
+
+@pytest.fixture(scope="module")
+def reference_png(seed_bench):
+    return render_png(STARTUP_METRICS, seed_bench["low"], seed_bench["high"], dpi=DPI)
+
+
+def test_submit_render_matches_serial_reference(seed_bench, reference_png):
+    futures = [
+        submit_render(STARTUP_METRICS, seed_bench["low"], seed_bench["high"], dpi=DPI) for _ in range(RENDERS)
+    ]
+    assert all(f.result() == reference_png for f in futures)
+
+
+def test_thread_fan_out_matches_serial_reference(seed_bench, reference_png):
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        outputs = list(
+            executor.map(
+                lambda _: render_png(STARTUP_METRICS, seed_bench["low"], seed_bench["high"], dpi=DPI),
+                range(RENDERS),
+            )
+        )
+    assert all(png == reference_png for png in outputs)
+
+
+def test_concurrent_renders_of_different_stages_do_not_interfere():
+    references = {
+        stage: render_png(STARTUP_METRICS, bench["low"], bench["high"], dpi=DPI)
+        for stage, bench in NAPKIN_BENCHMARKS.items()
+    }
+    stages = list(NAPKIN_BENCHMARKS) * 4
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        outputs = list(
+            executor.map(
+                lambda s: render_png(
+                    STARTUP_METRICS, NAPKIN_BENCHMARKS[s]["low"], NAPKIN_BENCHMARKS[s]["high"], dpi=DPI
+                ),
+                stages,
+            )
+        )
+    assert all(png == references[s] for s, png in zip(stages, outputs))
@@ -0,0 +1,72 @@
+import io
+from datetime import date
+
+import numpy as np
+import pytest
+
+from napkin_history import NAPKIN_HISTORY, add_version
+from napkin_plot import DEFAULT_METRIC_ORDER, NAPKIN_BENCHMARKS
+from napkin_store import load_results, read_portfolio, save_results, score_portfolio, select
+
+
+def _csv(*lines):
+    header = ",".join(["Startup", "Stage", *DEFAULT_METRIC_ORDER])
+    return io.StringIO("\n".join([header, *lines]))
+
+
+def test_read_portfolio_rejects_unknown_stages_all_at_once():
+    metrics = ",".join(["1"] * len(DEFAULT_METRIC_ORDER))
+    source = _csv(f"Acme,Seed,{metrics}", f"Beta,Series C,{metrics}", f"Gama,Series Z,{metrics}")
+    with pytest.raises(ValueError, match="linha 3 .*Series C.*linha 4 .*Series Z"):
+        read_portfolio(source)
+
+
+def test_read_portfolio_rejects_missing_metrics():
+    metrics = ",".join(["1"] * (len(DEFAULT_METRIC_ORDER) - 1))
+    with pytest.raises(ValueError, match=f"linha 2 .*{DEFAULT_METRIC_ORDER[-1]}"):
+        read_portfolio(_csv(f"Acme,Seed,{metrics},"))
+
+
+def test_score_portfolio_auto_stage_uses_version_valid_on_row_date():
+    # Nova versão do Seed bem acima de todos os estágios: só ela aceita a linha a partir de 2025-01-15
+    top = NAPKIN_BENCHMARKS["Series B"]["high"]
+    history = {stage: list(versions) for stage, versions in NAPKIN_HISTORY.items()}
+    add_version(
+        "Seed",
+        date(2025, 1, 15),
+        "2025-01-15-revised-q1",
+        {m: 3 * v for m, v in top.items()},
+        {m: 4 * v for m, v in top.items()},
+        history,
+    )
+    values = np.array([[3.5 * top[m] for m in DEFAULT_METRIC_ORDER]] * 2)
+    results = score_portfolio(["Antes", "Depois"], values, dates=["2025-01-14", "2025-01-15"], history=history)
+    assert results["stage"].tolist() == ["Series B", "Seed"]
+    assert results["version"].tolist() == ["v1", "2025-01-15-revised-q1"]
+
+
+def test_store_round_trip(tmp_path):
+    companies = ["Delta", "Alfa", "Charlie", "Bravo"]
+    stages = ["Series A", "Seed", "Series A", "Seed"]
+    values = np.arange(len(companies) * len(DEFAULT_METRIC_ORDER), dtype=float).reshape(len(companies), -1)
+    schema = save_results(tmp_path / "portfolio", score_portfolio(companies, values, stages))
+
+    results, loaded = load_results(tmp_path / "portfolio")
+    assert isinstance(results, np.memmap)
+    assert loaded["stages"] == schema["stages"] == {"Seed": [0, 2], "Series A": [2, 4]}
+
+    series_a = select(results, loaded, stage="Series A")
+    assert series_a["company"].tolist() == ["Charlie", "Delta"]
+    assert np.shares_memory(series_a, results)
+    assert select(results, loaded, stage="Series B").size == 0
+
+    picked = select(results, loaded, companies=["Bravo", "Delta"])
+    assert sorted(picked["company"].tolist()) == ["Bravo", "Delta"]
+    assert picked[picked["company"] == "Delta"]["raw"].tolist() == [values[0].tolist()]
+
+
+def test_store_empty_round_trip(tmp_path):
+    empty = score_portfolio(["Alfa"], np.ones((1, len(DEFAULT_METRIC_ORDER))), ["Seed"])[:0]
+    schema = save_results(tmp_path / "empty", empty)
+    results, loaded = load_results(tmp_path / "empty")
+    assert len(results) == 0 and schema["rows"] == 0 and loaded["stages"] == {}
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from napkin_plot import DEFAULT_METRIC_ORDER, NAPKIN_BENCHMARKS, normalize_array
+from napkin_uncertainty import sample_metrics, simulate
+
+
+BENCH = NAPKIN_BENCHMARKS["Seed"]
+POINT = {"ARR": 1.1, "Growth": 389.0, "Round Size": 3.5, "Valuation": 13.0, "Cap Table": 72.0, "Gross Margin": 82.0}
+RANGES = {m: (0.8 * v, v, 1.3 * v) if i % 2 else (0.9 * v, 1.1 * v) for i, (m, v) in enumerate(POINT.items())}
+
+
+def test_same_seed_gives_same_envelope():
+    first = simulate(RANGES, BENCH["low"], BENCH["high"], n=5_000, seed=7)
+    second = simulate(RANGES, BENCH["low"], BENCH["high"], n=5_000, seed=7)
+    assert first["envelope"] == second["envelope"]
+    assert first["median"] == second["median"]
+
+
+def test_envelope_brackets_median():
+    mc = simulate(RANGES, BENCH["low"], BENCH["high"], n=5_000)
+    lower, upper = np.array(mc["envelope"][0]), np.array(mc["envelope"][1])
+    median = np.array(mc["median"])
+    assert np.all(lower <= median) and np.all(median <= upper)
+
+
+def test_scalar_specs_collapse_envelope_to_point():
+    mc = simulate(POINT, BENCH["low"], BENCH["high"], n=1_000)
+    expected = normalize_array(
+        [POINT[m] for m in DEFAULT_METRIC_ORDER],
+        [BENCH["low"][m] for m in DEFAULT_METRIC_ORDER],
+        [BENCH["high"][m] for m in DEFAULT_METRIC_ORDER],
+    )
+    assert mc["envelope"][0] == pytest.approx(expected.tolist())
+    assert mc["envelope"][1] == pytest.approx(expected.tolist())
+
+
+def test_triangular_spec_with_mode_outside_range_raises():
+    with pytest.raises(ValueError, match="ARR"):
+        sample_metrics({**POINT, "ARR": (1.0, 5.0, 2.0)}, n=10)
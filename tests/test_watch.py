@@ -0,0 +1,55 @@
+from datetime import date
+
+import napkin_watch
+from napkin_history import NAPKIN_HISTORY, add_version
+
+
+def test_watch_survives_invalid_csv(tmp_path, monkeypatch, capsys):
+    csv_path = tmp_path / "portfolio.csv"
+    csv_path.write_text("Startup,ARR\nAcme,1\n")
+
+    def stop(_interval):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(napkin_watch.time, "sleep", stop)
+    napkin_watch.watch(csv_path, tmp_path / "charts")
+    assert "Erro ao reconstruir" in capsys.readouterr().out
+    assert not (tmp_path / "charts" / napkin_watch.MANIFEST_NAME).exists()
+
+
+def test_resolve_benchmark_falls_back_to_default_date():
+    history = {stage: list(versions) for stage, versions in NAPKIN_HISTORY.items()}
+    seed = NAPKIN_HISTORY["Seed"][0]
+    add_version("Seed", date(2025, 7, 1), "v2", seed["low"], seed["high"], history)
+    row = {"company": "Acme", "stage": "Seed", "date": None, "metrics": {}}
+    _, bench = napkin_watch.resolve_benchmark(row, history, default_date=date(2025, 6, 30))
+    assert bench["version"] == "v1"
+
+
+def _row(company, arr):
+    metrics = {
+        "ARR": arr,
+        "Growth": 389.0,
+        "Round Size": 3.5,
+        "Valuation": 13.0,
+        "Cap Table": 72.0,
+        "Gross Margin": 82.0,
+    }
+    return {"company": company, "stage": "Seed", "date": date(2025, 1, 1), "metrics": metrics}
+
+
+def test_rebuild_renders_only_changed_rows(tmp_path):
+    rows = [_row("Acme", 1.0), _row("Beta", 2.0), _row("Gama", 3.0)]
+
+    def counts(stats):
+        return stats["rendered"], stats["skipped"], stats["deleted"]
+
+    assert counts(napkin_watch.rebuild(rows, tmp_path, dpi=20)) == (3, 0, 0)
+    assert counts(napkin_watch.rebuild(rows, tmp_path, dpi=20)) == (0, 3, 0)
+
+    edited = [_row("Acme", 5.0), rows[1]]
+    assert counts(napkin_watch.rebuild(edited, tmp_path, dpi=20)) == (1, 1, 1)
+    assert not (tmp_path / "gama.png").exists()
+    assert sorted(p.name for p in tmp_path.glob("*.png")) == ["acme.png", "beta.png"]
+
+    assert counts(napkin_watch.rebuild(edited, tmp_path, dpi=30)) == (2, 0, 0)